@@ -0,0 +1,222 @@
+# _________________________________________________________________________
+# 🟢 Array Backend – rotateArray / moveZeros dispatch on container type
+# _________________________________________________________________________
+
+# Problem:
+# day2.py rotateArray / moveZeros list-la element by element Python loop.
+# Numeric data numpy.ndarray / array.array-la irundha vectorized-aa pannalam.
+
+# Pattern:
+# Type dispatch (functools.singledispatch).
+# * list (and any other mutable sequence) → current in-place path
+# * numpy.ndarray → slice copies (roll) / boolean mask (compaction)
+#                   in-place rotate temp <= SCRATCH items (1e7 int64,
+#                   k = n/2 → 0.5 MiB peak; whole-side copy-la 40 MB)
+# * array.array   → numpy view over the same buffer (zero-copy) if numpy
+#                   irundha, illana list path
+
+# Key logic:
+# out=None → in-place, same object return aagum (day2.py behaviour).
+# out=buf  → result buf-la ezhudhum, arr touch aagadhu. Hot loop-la same
+#            buffer reuse panna allocation illa.
+# numpy optional – install pannalana list path mattum work aagum.
+
+# _________________________________________________________________________
+
+from array import array
+from functools import singledispatch
+
+from partition import KEEP_NONZERO, stablePartition
+from rotation import rotateInPlace
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana list / array.array path mattum
+    np = None
+
+
+SCRATCH = 1 << 16    # in-place ndarray rotate: max temp items
+
+
+SCRATCH = 1 << 16    # in-place ndarray rotate: max temp items
+
+
+def _checkOut(arr, out):
+    if len(out) != len(arr):
+        raise ValueError(f"out has length {len(out)}, expected {len(arr)}")
+
+
+def _numpyView(buf):
+    # array.array → ndarray over the same memory (no copy)
+    try:
+        return np.frombuffer(buf, dtype=buf.typecode)
+    except TypeError:  # 'u' typecode etc. – numpy dtype illa
+        return None
+
+
+# _________________________________________________________________________
+# rotateArray (right rotate by k)
+# _________________________________________________________________________
+
+@singledispatch
+def rotateArray(arr, k, out=None):
+    n = len(arr)
+    if out is None or out is arr:
+        return rotateInPlace(arr, k)
+    _checkOut(arr, out)
+    if n == 0:
+        return out
+    k = k % n
+    out[k:] = arr[:n - k]
+    out[:k] = arr[n - k:]
+    return out
+
+
+@rotateArray.register(array)
+def _(arr, k, out=None):
+    if np is None or len(arr) == 0:
+        return rotateArray.dispatch(object)(arr, k, out)
+    view = _numpyView(arr)
+    if view is None:
+        return rotateArray.dispatch(object)(arr, k, out)
+    if out is None or out is arr:
+        _rotateNumpy(view, k, None)
+        return arr
+    _checkOut(arr, out)
+    outView = _numpyView(out) if isinstance(out, array) else out
+    _rotateNumpy(view, k, outView)
+    return out
+
+
+def _swapNumpy(arr, i, j, m, tmp):
+    # arr[i:i+m] <-> arr[j:j+m] (overlap illa), tmp size blocks-aa
+    for off in range(0, m, len(tmp)):
+        size = min(len(tmp), m - off)
+        a = arr[i + off:i + off + size]
+        b = arr[j + off:j + off + size]
+        t = tmp[:size]
+        t[...] = a
+        a[...] = b
+        b[...] = t
+
+
+def _swapNumpy(arr, i, j, m, tmp):
+    # arr[i:i+m] <-> arr[j:j+m] (overlap illa), tmp size blocks-aa
+    for off in range(0, m, len(tmp)):
+        size = min(len(tmp), m - off)
+        a = arr[i + off:i + off + size]
+        b = arr[j + off:j + off + size]
+        t = tmp[:size]
+        t[...] = a
+        a[...] = b
+        b[...] = t
+
+
+def _shiftNumpy(arr, k):
+    # right rotate: smaller side mattum temp copy, meedhi numpy overlap-safe memmove
+    n = len(arr)
+    if k <= n - k:
+        tmp = arr[n - k:].copy()
+        arr[k:] = arr[:n - k]
+        arr[:k] = tmp
+    else:
+        tmp = arr[:n - k].copy()
+        arr[:k] = arr[n - k:]
+        arr[k:] = tmp
+
+
+def _rotateNumpy(arr, k, out=None):
+    n = len(arr)
+    if n == 0:
+        return arr if out is None else out
+    k = k % n
+    if out is None or out is arr:
+        if k == 0:
+            return arr
+        if min(k, n - k) <= SCRATCH:
+            _shiftNumpy(arr, k)
+            return arr
+        # rendu side-um perusu → Gries-Mills block swaps (rotation.py maadhiri),
+        # temp = SCRATCH items. Meedhi region-la oru side SCRATCH-kulla vandhaa
+        # _shiftNumpy (chinna swaps loop thavirkka)
+        tmp = np.empty(SCRATCH, dtype=arr.dtype)
+        d = n - k
+        i, j = d, k         # arr[d - i:d] ↔ arr[d:d + j] innum place aagala
+        while min(i, j) > SCRATCH:
+            if i < j:
+                _swapNumpy(arr, d - i, d + j - i, i, tmp)
+                j -= i
+            elif i > j:
+                _swapNumpy(arr, d - i, d, j, tmp)
+                i -= j
+            else:
+                _swapNumpy(arr, d - i, d, i, tmp)
+                return arr
+        _shiftNumpy(arr[d - i:d + j], j)
+        return arr
+    _checkOut(arr, out)
+    out[:k] = arr[n - k:]
+    out[k:] = arr[:n - k]
+    return out
+
+
+# _________________________________________________________________________
+# moveZeros (non-zero order same, zeros end-la)
+# _________________________________________________________________________
+
+@singledispatch
+def moveZeros(arr, out=None):
+    if out is not None and out is not arr:
+        _checkOut(arr, out)
+        out[:] = arr
+        arr = out
+
+    stablePartition(arr, KEEP_NONZERO)
+    return arr
+
+
+@moveZeros.register(array)
+def _(arr, out=None):
+    if np is None or len(arr) == 0:
+        return moveZeros.dispatch(object)(arr, out)
+    view = _numpyView(arr)
+    if view is None:
+        return moveZeros.dispatch(object)(arr, out)
+    if out is None or out is arr:
+        _moveZerosNumpy(view, None)
+        return arr
+    _checkOut(arr, out)
+    outView = _numpyView(out) if isinstance(out, array) else out
+    _moveZerosNumpy(view, outView)
+    return out
+
+
+def _moveZerosNumpy(arr, out=None):
+    mask = arr != 0
+    m = int(np.count_nonzero(mask))
+    if out is None or out is arr:
+        arr[:m] = arr[mask]
+        arr[m:] = 0
+        return arr
+    _checkOut(arr, out)
+    if out.dtype == arr.dtype:
+        np.compress(mask, arr, out=out[:m])  # straight into out, no temp
+    else:
+        out[:m] = arr[mask]
+    out[m:] = 0
+    return out
+
+
+if np is not None:
+    rotateArray.register(np.ndarray, _rotateNumpy)
+    moveZeros.register(np.ndarray, _moveZerosNumpy)
+
+
+if __name__ == "__main__":
+    print(rotateArray([1, 2, 3, 4, 5], 2))
+    print(moveZeros([0, 1, 0, 3, 12]))
+    print(moveZeros(array("q", [0, 1, 0, 3, 12])))
+    if np is not None:
+        buf = np.empty(5, dtype=np.int64)
+        print(rotateArray(np.arange(1, 6), 2, out=buf))
+        print(moveZeros(np.array([0, 1, 0, 3, 12]), out=buf))
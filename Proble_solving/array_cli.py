@@ -0,0 +1,202 @@
+# _________________________________________________________________________
+# 🟢 Array CLI – rotateArray / reverse / moveZeros over files & stdin
+# _________________________________________________________________________
+
+# Problem:
+# day2.py-la arr = [1, 2, 3, 4, 5] hard-coded. Real data file / pipe-la
+# irukku; edit panni run panna mudiyaadhu, GB size data list-la load
+# panna RAM podhaadhu.
+
+# Usage (Proble_solving folder-la irundhu):
+# python -m array_cli --rotate 2 --move-zeros < nums.txt
+# python -m array_cli -f binary -t q --reverse -i data.bin -o out.bin
+# cat nums.csv | python -m array_cli -f csv --rotate -3 --reverse -F lines
+
+# Key logic:
+# * Read: big blocks (READ_CHUNK bytes). binary → array.frombytes (raw
+#   copy); text → block split panni map(int / float), block end-la
+#   udanja number adutha block-oda serkkurom. Storage array.array (8 B
+#   per value, list-a vida ~4x kammi). iterBinary / iterText chunk chunk-aa
+#   yield pannum – main() extend pannum, stream_stats full load pannaadhu.
+# * Transforms command line order-la ArrayPipeline-ku → rotate / reverse
+#   ellam oru index mapping, moveZeros compact – fused passes.
+#   numpy irundha array.array-a zero-copy ndarray view aakki vectorized
+#   path; illana list path.
+# * Write: binary → tofile (one bulk write); text → WRITE_CHUNK values
+#   join panni oru write.
+
+# _________________________________________________________________________
+
+import argparse
+import sys
+import time
+from array import array
+
+from pipeline import ArrayPipeline
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana list path
+    np = None
+
+
+READ_CHUNK = 1 << 24     # bytes per read (16 MiB)
+WRITE_CHUNK = 1 << 16    # values per text write
+FORMATS = ("lines", "csv", "binary")
+_SEPARATORS = (b"\n", b",", b" ", b"\t", b"\r")
+
+
+def iterBinary(f, typecode, chunkBytes=READ_CHUNK):
+    # chunk by chunk array(typecode) – full file memory-la venaam
+    itemsize = array(typecode).itemsize
+    tail = b""
+    while True:
+        block = f.read(chunkBytes)
+        if not block:
+            break
+        if tail:
+            block = tail + block
+        cut = len(block) - len(block) % itemsize
+        if cut:
+            chunk = array(typecode)
+            chunk.frombytes(memoryview(block)[:cut])     # oru copy mattum
+            yield chunk
+        tail = block[cut:]
+    if tail:
+        raise ValueError(f"input size is not a multiple of itemsize {itemsize}")
+
+
+def iterTextBlocks(f, chunkBytes=READ_CHUNK):
+    # raw bytes blocks, ovvonnum separator-la mudiyum (number udaiyaadhu)
+    tail = b""
+    while True:
+        block = f.read(chunkBytes)
+        if not block:
+            break
+        block = tail + block
+        cut = max(block.rfind(sep) for sep in _SEPARATORS) + 1
+        if cut:
+            yield block[:cut]
+        tail = block[cut:]
+    if tail:
+        yield tail
+
+
+def parseText(block, typecode):
+    # lines / csv rendum: separators (newline, comma, space) ellam same
+    parse = float if typecode in "fd" else int
+    if b"," in block:
+        block = block.replace(b",", b" ")
+    return array(typecode, map(parse, block.split()))
+
+
+def iterText(f, typecode, chunkBytes=READ_CHUNK):
+    for block in iterTextBlocks(f, chunkBytes):
+        chunk = parseText(block, typecode)
+        if chunk:
+            yield chunk
+
+
+def iterChunks(f, typecode, fmt="lines", chunkBytes=READ_CHUNK):
+    if fmt == "binary":
+        return iterBinary(f, typecode, chunkBytes)
+    return iterText(f, typecode, chunkBytes)
+
+
+def writeBinary(f, data):
+    if np is not None and isinstance(data, np.ndarray):
+        f.write(memoryview(np.ascontiguousarray(data)).cast("B"))
+    else:
+        data.tofile(f)
+
+
+def writeText(f, data, fmt):
+    sep = "," if fmt == "csv" else "\n"
+    for i in range(0, len(data), WRITE_CHUNK):
+        chunk = data[i:i + WRITE_CHUNK]
+        if np is not None and isinstance(chunk, np.ndarray):
+            chunk = chunk.tolist()
+        text = sep.join(map(str, chunk))
+        f.write(((sep if i and fmt == "csv" else "") + text + ("\n" if fmt == "lines" else "")).encode())
+    if fmt == "csv" and len(data):
+        f.write(b"\n")
+
+
+class _Step(argparse.Action):
+    # transforms command line order-la namespace.steps-la serkkum
+    def __call__(self, parser, namespace, values, option_string=None):
+        steps = getattr(namespace, "steps", None) or []
+        steps.append((self.dest, values))
+        namespace.steps = steps
+
+
+def buildPipeline(steps):
+    pipeline = ArrayPipeline()
+    for name, value in steps:
+        if name == "rotate":
+            pipeline.rotate(value)
+        elif name == "reverse":
+            pipeline.reverse()
+        else:
+            pipeline.compact()
+    return pipeline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m array_cli",
+        description="Rotate / reverse / moveZeros numeric data from files or stdin.",
+    )
+    parser.add_argument("-i", "--input", default="-", help="input file (default stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default stdout)")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="lines")
+    parser.add_argument("-F", "--out-format", choices=FORMATS,
+                        help="output format (default same as --format)")
+    parser.add_argument("-t", "--typecode", default="q",
+                        help="array typecode: q int64 (default), d float64, i, f, ...")
+    parser.add_argument("--rotate", type=int, action=_Step, metavar="K",
+                        help="right rotate by K (negative = left); repeatable")
+    parser.add_argument("--reverse", nargs=0, action=_Step)
+    parser.add_argument("--move-zeros", dest="compact", nargs=0, action=_Step)
+    parser.add_argument("-v", "--verbose", action="store_true", help="timings on stderr")
+    args = parser.parse_args(argv)
+    steps = getattr(args, "steps", None) or []
+    outFormat = args.out_format or args.format
+
+    start = time.perf_counter()
+    src = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    try:
+        data = array(args.typecode)
+        for chunk in iterChunks(src, args.typecode, args.format):
+            data.extend(chunk)
+    finally:
+        if src is not sys.stdin.buffer:
+            src.close()
+    loaded = time.perf_counter()
+
+    pipeline = buildPipeline(steps)
+    if np is not None and len(data):
+        data = np.frombuffer(data, dtype=args.typecode)     # zero-copy view
+    result = pipeline.run(data) if steps else data
+    done = time.perf_counter()
+
+    dst = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        if outFormat == "binary":
+            writeBinary(dst, result)
+        else:
+            writeText(dst, result, outFormat)
+        dst.flush()
+    finally:
+        if dst is not sys.stdout.buffer:
+            dst.close()
+
+    if args.verbose:
+        print(f"{len(result):,} values, {pipeline}\n"
+              f"read {loaded - start:.3f} s, transform {done - loaded:.3f} s, "
+              f"write {time.perf_counter() - done:.3f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# _________________________________________________________________________
+# 🟢 Batched Row Rotation – each row right rotate by its own k
+# _________________________________________________________________________
+
+# Problem:
+# Aayiram rows, ovvoru row-ku vera k. Python loop-la rotateArray call
+# panna per-call overhead dhaan adhigam.
+
+# Pattern:
+# Index manipulation → one vectorized gather.
+
+# Key logic:
+# row r-la output column c = input column (c - k[r]) % w
+# cols = (arange(w) - k[:, None]) % w
+# flat index = cols + r * w → np.take(flat, idx, out=...) oru gather-la mudiyum.
+# Index array rows * w size aagum, so CHUNK_ITEMS varaikkum rows group panni
+# gather pannrom (index memory bounded).
+# inplace=True → same matrix-la result (chunk temp vazhiya copy back).
+# Romba wide rows (>= WIDE_ROW) → per-row rendu slice copy dhaan fast,
+# gather-oda index build cost adhigam (benchmark paarunga).
+# numpy illana / ragged nested list-na per-row rotation engine fallback.
+
+# _________________________________________________________________________
+
+from array_backend import _rotateNumpy
+from rotation import rotateInPlace
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana nested-list path mattum
+    np = None
+
+
+CHUNK_ITEMS = 1 << 20   # index array max items per gather
+WIDE_ROW = 512          # idhukku mela width → per-row slice copy
+
+
+def _rotateRowsList(matrix, shifts, inplace, out):
+    rows = len(matrix)
+    if isinstance(shifts, int):
+        shifts = [shifts] * rows
+    if len(shifts) != rows:
+        raise ValueError(f"got {len(shifts)} shifts for {rows} rows")
+
+    if inplace:
+        for row, k in zip(matrix, shifts):
+            rotateInPlace(row, k)
+        return matrix
+
+    if out is None:
+        out = [None] * rows
+    for r, (row, k) in enumerate(zip(matrix, shifts)):
+        w = len(row)
+        k = k % w if w else 0
+        out[r] = row[w - k:] + row[:w - k]
+    return out
+
+
+def _rotateRowsNumpy(matrix, shifts, inplace, out):
+    if matrix.ndim != 2:
+        raise ValueError(f"expected a 2-D array, got {matrix.ndim}-D")
+    rows, w = matrix.shape
+    shifts = np.broadcast_to(np.asarray(shifts, dtype=np.intp), (rows,))
+
+    if inplace:
+        out = matrix
+    elif out is None:
+        out = np.empty_like(matrix)
+    elif out.shape != matrix.shape:
+        raise ValueError(f"out has shape {out.shape}, expected {matrix.shape}")
+    if rows == 0 or w == 0:
+        return out
+
+    if w >= WIDE_ROW:
+        # wide rows: rendu slice copy per row (memcpy) gather-a vida fast
+        for r in range(rows):
+            _rotateNumpy(matrix[r], int(shifts[r]), None if inplace else out[r])
+        return out
+
+    shifts = shifts % w   # rows size mattum, so cheap; ini 0 <= k < w
+    src = matrix if matrix.flags.c_contiguous else np.ascontiguousarray(matrix)
+    cols = np.arange(w, dtype=np.intp)
+    step = max(1, CHUNK_ITEMS // w)
+    for r0 in range(0, rows, step):
+        r1 = min(rows, r0 + step)
+        idx = np.subtract(cols, shifts[r0:r1, None])
+        np.add(idx, w, out=idx, where=idx < 0)   # % w vida cheap
+        idx += (np.arange(r1 - r0, dtype=np.intp) * w)[:, None]
+        block = src[r0:r1].reshape(-1)
+        target = out[r0:r1]
+        if inplace or not target.flags.c_contiguous:
+            # same buffer-la read + write → chunk temp vazhiya copy back
+            target[...] = np.take(block, idx, mode="clip")
+        else:
+            np.take(block, idx, out=target, mode="clip")
+    return out
+
+
+def rotateRows(matrix, shifts, inplace=False, out=None):
+    # shifts = one k per row (or oru int ellaa rows-kum)
+    if np is not None and isinstance(matrix, np.ndarray):
+        return _rotateRowsNumpy(matrix, shifts, inplace, out)
+    return _rotateRowsList(matrix, shifts, inplace, out)
+
+
+# _________________________________________________________________________
+# Benchmark (python batch_rotate.py)
+# _________________________________________________________________________
+
+def _bench(rowCounts=(100, 1000, 10000), widths=(16, 256, 4096), repeats=3):
+    import random
+    import time
+
+    from array_backend import rotateArray
+
+    def best(fn):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000
+
+    for rows in rowCounts:
+        for w in widths:
+            if rows * w > 10**7:
+                continue
+            shifts = [random.randrange(w) for _ in range(rows)]
+            nested = [list(range(w)) for _ in range(rows)]
+
+            loop = best(lambda: [rotateArray(row, k) for row, k in zip(nested, shifts)])
+            batchList = best(lambda: rotateRows(nested, shifts, inplace=True))
+            line = (f"rows={rows:>6} w={w:>5}: loop rotateArray {loop:9.2f} ms"
+                    f"  rotateRows(list) {batchList:9.2f} ms")
+
+            if np is not None:
+                mat = np.arange(rows * w, dtype=np.int64).reshape(rows, w)
+                ks = np.array(shifts)
+                buf = np.empty_like(mat)
+                npLoop = best(lambda: [rotateArray(mat[r], ks[r], out=buf[r]) for r in range(rows)])
+                gather = best(lambda: rotateRows(mat, ks, out=buf))
+                inPlace = best(lambda: rotateRows(mat, ks, inplace=True))
+                line += (f"\n{'':>19}ndarray loop {npLoop:8.2f} ms  rotateRows(out=) {gather:8.2f} ms"
+                         f"  inplace {inPlace:8.2f} ms")
+            print(line)
+
+
+# Numbers (CPython 3.11, NumPy 2.x, int64 / list of int, best of 3):
+#
+# rows     w   loop rotateArray(list)  ndarray rotateArray loop  rotateRows(out=)  inplace
+#  1000    16        1.14 ms                 2.02 ms                0.10 ms        0.10 ms
+#  1000   256        1.53 ms                 2.18 ms                0.99 ms        1.17 ms
+#  1000  4096       10.61 ms                 8.37 ms                6.57 ms        5.00 ms
+# 10000    16       11.71 ms                22.31 ms                0.95 ms        1.11 ms
+# 10000   256       16.72 ms                24.36 ms               14.10 ms       18.04 ms
+#
+# 👉 narrow rows-la (w=16) per-call overhead dhaan ellaam – gather 10-20x fast
+# 👉 w=256-la gather-um loop-um kitta kitta; w >= WIDE_ROW → slice-copy path
+
+
+if __name__ == "__main__":
+    print(rotateRows([[1, 2, 3, 4, 5], [1, 2, 3, 4, 5]], [2, 1]))
+    _bench()
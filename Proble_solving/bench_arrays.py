@@ -0,0 +1,245 @@
+# _________________________________________________________________________
+# 🟢 Benchmark Suite – Proble_solving array algorithms
+# _________________________________________________________________________
+
+# Problem:
+# Rendu rotateArray versions, day1 two pointer reverse, moveZeros – edhu
+# fast, edhu memory edukkum nu realistic sizes-la compare panna vazhi illa.
+
+# Key logic:
+# * Every variant × container (list int/float, array.array q/d, bytearray,
+#   numpy irundha ndarray) × size (1e3 → 1e8, 10x steps).
+# * time  = best of --repeats (perf_counter), input copy time count illa
+# * peak  = tracemalloc peak during one extra run (bytes)
+# * allocs = tracemalloc snapshot diff – call mudinja apram innum live-aa
+#   irukkura new blocks (leak / retained buffers kandupidikka)
+# * Result JSON-la save; --baseline old.json kuduthaa same key-ku
+#   time / peak --threshold-a vida adhigam aana REGRESSION print + exit 1.
+# * Variant container-a support pannalana (TypeError) skip; oru size-ku
+#   --max-seconds mela aana adhukku mela sizes skip.
+
+# Usage (Proble_solving folder-la irundhu):
+# python bench_arrays.py --max-size 1e6 --out bench.json
+# python bench_arrays.py --max-size 1e6 --baseline bench.json --threshold 0.15
+
+# Stdlib mattum dhaan venum; numpy irundha ndarray container extra-aa add aagum.
+
+# _________________________________________________________________________
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from datetime import datetime, timezone
+
+from array_backend import moveZeros as backendMoveZeros
+from array_backend import rotateArray as backendRotate
+from partition import stablePartition
+from reverse_kernel import reverseInPlace
+from rotation import rotateInPlace, rotateSlice
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana ndarray container skip
+    np = None
+
+
+# _________________________________________________________________________
+# Variants – day1 / day2 code apdiye copy (import panna day2.py print pannum)
+# _________________________________________________________________________
+
+def day2ReverseRotate(arr, k):
+    # day2.py first rotateArray (reverse + reversed slices)
+    n = len(arr)
+    k = k % n
+    arr.reverse()
+    arr[:k] = reversed(arr[:k])
+    arr[k:] = reversed(arr[k:])
+    return arr
+
+
+def day1TwoPointerReverse(data):
+    # day1.py while i < j swap loop
+    i = 0
+    j = len(data) - 1
+    while i < j:
+        data[i], data[j] = data[j], data[i]
+        i += 1
+        j -= 1
+    return data
+
+
+def day2MoveZeros(arr):
+    # day2.py two pointer with the swap line fixed
+    j = 0
+    for i in range(len(arr)):
+        if arr[i] != 0:
+            arr[j], arr[i] = arr[i], arr[j]
+            j += 1
+    return arr
+
+
+# name → (function, ndarray-la run pannalama)
+VARIANTS = {
+    "rotate.day2_reverse": (lambda a: day2ReverseRotate(a, len(a) // 3), False),
+    "rotate.day2_slice": (lambda a: rotateSlice(a, len(a) // 3), False),
+    "rotate.engine": (lambda a: rotateInPlace(a, len(a) // 3), False),
+    "rotate.backend": (lambda a: backendRotate(a, len(a) // 3), True),
+    "reverse.day1_two_pointer": (day1TwoPointerReverse, True),
+    "reverse.kernel": (reverseInPlace, True),
+    "move_zeros.day2_two_pointer": (day2MoveZeros, True),
+    "move_zeros.partition": (stablePartition, False),
+    "move_zeros.backend": (backendMoveZeros, True),
+}
+
+
+def _values(n, floats):
+    rnd = random.Random(n)
+    if floats:
+        return [rnd.choice((0.0, 0.0, rnd.random())) for _ in range(n)]
+    return [rnd.choice((0, 0, rnd.randrange(1, 250))) for _ in range(n)]
+
+
+CONTAINERS = {
+    "list_int": lambda n: _values(n, False),
+    "list_float": lambda n: _values(n, True),
+    "array_q": lambda n: array("q", _values(n, False)),
+    "array_d": lambda n: array("d", _values(n, True)),
+    "bytearray": lambda n: bytearray(_values(n, False)),
+}
+if np is not None:
+    CONTAINERS["ndarray_int64"] = lambda n: np.array(_values(n, False), dtype=np.int64)
+    CONTAINERS["ndarray_float64"] = lambda n: np.array(_values(n, True), dtype=np.float64)
+
+
+def _copy(data):
+    return data.copy() if np is not None and isinstance(data, np.ndarray) else data[:]
+
+
+def sizesBetween(lo, hi):
+    sizes = []
+    n = int(lo)
+    while n <= hi:
+        sizes.append(n)
+        n *= 10
+    return sizes
+
+
+def measure(fn, data, repeats):
+    best = None
+    for _ in range(repeats):
+        work = _copy(data)
+        start = time.perf_counter()
+        fn(work)
+        took = time.perf_counter() - start
+        best = took if best is None or took < best else best
+
+    work = _copy(data)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    fn(work)
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    allocs = sum(s.count_diff for s in diff if s.count_diff > 0)
+    return {"seconds": best, "peakBytes": peak, "allocs": allocs}
+
+
+def run(variants, containers, sizes, repeats, maxSeconds, log=print):
+    results = []
+    for cname in containers:
+        skipped = set()
+        for n in sizes:
+            data = CONTAINERS[cname](n)
+            isNumpy = np is not None and isinstance(data, np.ndarray)
+            for vname in variants:
+                fn, numpyOk = VARIANTS[vname]
+                if vname in skipped or (isNumpy and not numpyOk):
+                    continue
+                try:
+                    row = measure(fn, data, repeats)
+                except TypeError:   # e.g. array.array slice = reversed(...)
+                    skipped.add(vname)
+                    log(f"skip {vname} on {cname}: unsupported container")
+                    continue
+                row.update(variant=vname, container=cname, size=n)
+                results.append(row)
+                log(f"{cname:>15} {vname:>28} n={n:>11,}: {row['seconds'] * 1000:10.3f} ms"
+                    f"  peak {row['peakBytes'] / 1024:10.1f} KiB  allocs {row['allocs']}")
+                if row["seconds"] > maxSeconds:
+                    skipped.add(vname)   # too slow, bigger sizes venaam
+            del data
+    return results
+
+
+def compare(results, baseline, threshold):
+    # baseline-oda same (variant, container, size) compare; regressions list
+    old = {(r["variant"], r["container"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        prev = old.get((r["variant"], r["container"], r["size"]))
+        if prev is None:
+            continue
+        for metric in ("seconds", "peakBytes"):
+            if prev[metric] and r[metric] > prev[metric] * (1 + threshold):
+                regressions.append({
+                    "variant": r["variant"], "container": r["container"], "size": r["size"],
+                    "metric": metric, "baseline": prev[metric], "current": r[metric],
+                    "ratio": r[metric] / prev[metric],
+                })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Proble_solving array routines.")
+    parser.add_argument("--min-size", type=float, default=1e3)
+    parser.add_argument("--max-size", type=float, default=1e6)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-seconds", type=float, default=5.0,
+                        help="skip bigger sizes for a variant once one run takes longer")
+    parser.add_argument("--variants", nargs="+", choices=sorted(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--containers", nargs="+", choices=sorted(CONTAINERS),
+                        default=list(CONTAINERS))
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown / memory growth ratio (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.variants, args.containers, sizesBetween(args.min_size, args.max_size),
+                  args.repeats, args.max_seconds)
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['variant']} {r['container']} n={r['size']:,} "
+                  f"{r['metric']}: {r['baseline']:.6g} → {r['current']:.6g} ({r['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print(f"no regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
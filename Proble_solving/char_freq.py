@@ -0,0 +1,164 @@
+# _________________________________________________________________________
+# 🟢 Char Frequency + Anagram Grouping – bulk counting, batch keys
+# _________________________________________________________________________
+
+# Problem:
+# Day 7 hashmap pattern: for ch in s: freq[ch] = freq.get(ch, 0) + 1.
+# Oru string-ku ok; millions of strings-la ovvoru character-kum oru
+# Python dict update → romba slow. Anagram grouping-la ovvoru word-kum
+# "".join(sorted(w)) – adhuvum per-word Python work.
+
+# Pattern:
+# Frequency HashMap (bulk counting) + canonical key (sorted chars) + grouping.
+
+# Key logic:
+# * byteHistogram: numpy.bincount(minlength=256) oru C pass. numpy illana
+#   present-aa irukkura bytes mattum bytes.count (ovvonnum C scan).
+# * charHistogram: ASCII text → encode panni byteHistogram. Unicode →
+#   utf-32 codepoints-a np.unique(counts); illana Counter (C loop).
+# * anagramKeys (batch): ellaa words-um oru string-aa join, oru encode.
+#   Value = (word number << bits) | char → oru np.sort-la ellaa words-um
+#   thanakkulla sort aagum (word number high bits, so words kalakkaadhu).
+#   Sorted chars-a oru decode, apram split (ASCII) / offsets-la slice →
+#   key == "".join(sorted(w)) exact-aa same (codepoint order).
+#       ["eat", "tea"] → (0,e)(0,a)(0,t)(1,t)(1,e)(1,a) → sort → "aet" "aet"
+# * groupAnagrams: keys-mela oru defaultdict pass → groups first-seen order.
+
+# _________________________________________________________________________
+
+from collections import Counter, defaultdict
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana bytes.count / Counter / sorted
+    np = None
+
+
+def byteHistogram(data):
+    # bytes / bytearray / memoryview → 256 counts
+    if np is not None:
+        return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256).tolist()
+    data = bytes(data)
+    counts = [0] * 256
+    for b in set(data):
+        counts[b] = data.count(b)
+    return counts
+
+
+def charHistogram(text):
+    # {char: count}, codepoint order
+    if text.isascii():
+        counts = byteHistogram(text.encode("ascii"))
+        return {chr(b): c for b, c in enumerate(counts) if c}
+    if np is not None:
+        cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        values, counts = np.unique(cps, return_counts=True)
+        return {chr(v): c for v, c in zip(values.tolist(), counts.tolist())}
+    return dict(sorted(Counter(text).items()))
+
+
+def isAnagram(a, b):
+    return len(a) == len(b) and charHistogram(a) == charHistogram(b)
+
+
+def anagramKeys(words, ignoreCase=False):
+    # ovvoru word-kum canonical key = "".join(sorted(word))
+    # words pala thadava padikkurom → generator-a oru thadava list aakkanum
+    words = [w.lower() for w in words] if ignoreCase else list(words)
+    if np is None or not words:
+        return ["".join(sorted(w)) for w in words]
+    if "".join(words).isascii():
+        # "\xff" terminator: ASCII-la varaadhu, ovvoru word-layum last-aa sort
+        # aagum → word number = munnaadi irukkura terminators count,
+        # result split("\xff") (per-word slicing illa)
+        chars = np.frombuffer(("\xff".join(words) + "\xff").encode("latin-1"), dtype=np.uint8)
+        ids = np.zeros(len(chars), dtype=np.int64)
+        np.cumsum(chars[:-1] == 0xFF, out=ids[1:])
+        packed = ids << 8
+        packed |= chars
+        packed.sort()
+        return packed.astype(np.uint8).tobytes().decode("latin-1").split("\xff")[:-1]
+    chars = np.frombuffer("".join(words).encode("utf-32-le"), dtype=np.uint32)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    packed = np.repeat(np.arange(len(words), dtype=np.int64) << 21, lengths)    # codepoint < 2^21
+    packed |= chars
+    packed.sort()
+    text = (packed & 0x1FFFFF).astype(np.uint32).tobytes().decode("utf-32-le")
+    ends = list(accumulate(lengths.tolist()))
+    return [text[a:b] for a, b in zip([0] + ends, ends)]
+
+
+def groupAnagrams(words, ignoreCase=False):
+    # single hash pass; groups first-seen order-la
+    words = list(words)
+    groups = defaultdict(list)
+    for word, key in zip(words, anagramKeys(words, ignoreCase)):
+        groups[key].append(word)
+    return list(groups.values())
+
+
+# _________________________________________________________________________
+# Benchmark (python char_freq.py)
+# _________________________________________________________________________
+
+def _bench(words=1_000_000):
+    import random
+    import time
+
+    rng = random.Random(7)
+    corpus = ["".join(rng.choices("abcdefgh", k=rng.randint(3, 10))) for _ in range(words)]
+    text = " ".join(corpus)
+    chars = len(text)
+
+    def timed(label, fn, amount, unit):
+        start = time.perf_counter()
+        result = fn()
+        took = time.perf_counter() - start
+        print(f"{label:<28} {took:7.3f} s  {amount / took / 1e6:7.2f} M {unit}/s")
+        return result
+
+    def dictLoop():
+        freq = {}
+        for ch in text:
+            freq[ch] = freq.get(ch, 0) + 1
+        return freq
+
+    def sortedKeys():
+        groups = {}
+        for w in corpus:
+            groups.setdefault("".join(sorted(w)), []).append(w)
+        return list(groups.values())
+
+    a = timed("dict loop histogram", dictLoop, chars, "chars")
+    b = timed("Counter histogram", lambda: Counter(text), chars, "chars")
+    c = timed("charHistogram", lambda: charHistogram(text), chars, "chars")
+    assert a == b == c
+    d = timed("group: sorted() per word", sortedKeys, words, "words")
+    e = timed("groupAnagrams", lambda: groupAnagrams(corpus), words, "words")
+    assert d == e
+    print(f"{words:,} words, {chars:,} chars, {len(e):,} groups")
+
+
+# Numbers (CPython 3.11, NumPy 2.x, 10 lakh words of 3-10 chars, 'a'-'h',
+# 75 lakh chars, 36,805 groups):
+#
+# dict loop histogram          0.550 s     13.63 M chars/s
+# Counter histogram            0.333 s     22.53 M chars/s
+# charHistogram                0.037 s    205.04 M chars/s   (numpy illana 0.23 s)
+# group: sorted() per word     1.134 s      0.88 M words/s
+# groupAnagrams                0.822 s      1.22 M words/s
+#
+# 👉 histogram ~15x vs dict loop (bincount); numpy illana bytes.count ~2.5x
+# 👉 keys mattum: anagramKeys 0.30 s vs sorted() list 0.67 s (~2.2x).
+#    Meedhi time dict grouping pass (~0.4 s, Python loop) – adhu thavirkka
+#    mudiyaadhu, groups Python lists dhaan.
+
+
+if __name__ == "__main__":
+    print(charHistogram("banana"))                          # {'a': 3, 'b': 1, 'n': 2}
+    print(isAnagram("listen", "silent"), isAnagram("rat", "car"))
+    print(anagramKeys(["eat", "tea", "café"]))              # ['aet', 'aet', 'acfé']
+    print(groupAnagrams(["eat", "tea", "tan", "ate", "nat", "bat"]))
+    print(groupAnagrams(["Listen", "Silent", "enlist"], ignoreCase=True))
+    _bench()
@@ -0,0 +1,224 @@
+# _________________________________________________________________________
+# 🟢 Complexity Profiler – "grows proportionally" measure pannradhu
+# _________________________________________________________________________
+
+# Problem:
+# day1.py-la O(n) vs O(n²) kaiyaala steps count panni sonnom
+# (n = 5 → 25 steps, n = 10 → 100 steps). Real code-ku adhu correct-aa
+# nu time eduthu paakkanum.
+
+# Pattern:
+# Geometric sizes (n, 2n, 4n ...) + least squares curve fit.
+
+# Key logic:
+# * gen(n) → fresh input; fn(input) time pannrom (gen time count illa),
+#   best of repeats. Extra run-la tracemalloc peak = memory.
+# * Oru call MIN_SAMPLE-a vida fast-aa mudinjaa timer noise dhaan theriyum,
+#   so adhe input-la pala thadava call panni average (timeit autorange maari).
+#   In-place functions second call-la already-processed input paakkum –
+#   cost same order dhaan, class maaradhu.
+# * Ovvoru model f(n) (1, log n, n, n log n, n²)-ku t ≈ c · f(n) fit.
+#   Timings 1000x range-la irukkum, so relative error minimise pannrom:
+#   c = Σ(f/t) / Σ(f²/t²),  residual = Σ(1 - c·f/t)²
+#   c = constant factor (sec per f(n)).
+# * Class choose: smallest residual. Adhu O(log n) / O(n log n) na, log
+#   factor illaadha class (O(1) / O(n)) residual MARGIN times-kulla irundha
+#   simpler class dhaan. Cache / allocator effects-la len() kooda n-oda
+#   konjam valarum, O(log n) "konjam better fit" aagum; clear margin cut
+#   illaama higher class sollakoodaadhu.
+# * Memory peak-kum adhe fit → O(1) na in-place, O(n) na copy edukkudhu.
+
+# Mistake I made:
+# n too small-aa irundha (< 1000) function call overhead dhaan theriyum –
+# ellame O(1) maari fit aagum. Sizes periya range-la kudukkanum.
+# Raw smallest residual eduthappo len() / index lookup O(log n), list(a)
+# O(n log n) nu vandhuchu (cache misses kooda n-oda konjam valarum) –
+# adhukku dhaan MARGIN rule. Examples expected class-oda check aagum.
+
+# _________________________________________________________________________
+
+import math
+import time
+import tracemalloc
+
+
+MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n) * n,
+}
+
+MIN_SAMPLE = 1e-3    # seconds; idhukku keezha oru call time nambaadhe
+MEMORY_FLOOR = 64   # bytes; tracemalloc peak 0-aa irundha relative error udanjidum
+MARGIN = 4.0        # higher class-ku residual ivlo times kammi aaganum
+
+
+class Fit:
+    # one model fit: label, constant factor, relative residual
+
+    def __init__(self, label, constant, residual):
+        self.label = label
+        self.constant = constant
+        self.residual = residual
+
+    def __repr__(self):
+        return f"Fit({self.label}, c={self.constant:.3g}, residual={self.residual:.3g})"
+
+
+def geometricSizes(minSize=1000, maxSize=256000, factor=2):
+    if minSize < 2 or factor <= 1:
+        raise ValueError("minSize must be >= 2 and factor > 1")
+    sizes = []
+    n = minSize
+    while n <= maxSize:
+        sizes.append(int(n))
+        n *= factor
+    return sizes
+
+
+# log factor mattum vithyaasam – 1k..256k range-la ~2x dhaan, noise-la kalandhidum
+_LOG_STEP = {"O(log n)": "O(1)", "O(n log n)": "O(n)"}
+
+
+def chooseFit(fits):
+    # smallest residual; adhu log-factor class-na, keezha irukkura class
+    # MARGIN-kulla irundha simpler class
+    best = min(fits, key=lambda fit: fit.residual)
+    simpler = _LOG_STEP.get(best.label)
+    for fit in fits:
+        if fit.label == simpler and fit.residual <= best.residual * MARGIN:
+            return fit
+    return best
+
+
+def fitModels(sizes, values, floor=0.0):
+    # ellaa models-um fit; chosen class first, matthadhu residual order-la
+    values = [max(v, floor) for v in values]
+    fits = []
+    for label, f in MODELS.items():
+        ratios = [f(n) / v for n, v in zip(sizes, values)]
+        c = sum(ratios) / sum(r * r for r in ratios)
+        residual = sum((1 - c * r) ** 2 for r in ratios)
+        fits.append(Fit(label, c, residual))
+    chosen = chooseFit(fits)
+    fits.remove(chosen)
+    fits.sort(key=lambda fit: fit.residual)
+    return [chosen] + fits
+
+
+class Profile:
+    # profile() result: samples + time / memory fits
+
+    def __init__(self, name, samples):
+        self.name = name
+        self.samples = samples      # [(n, seconds, peakBytes)]
+        sizes = [s[0] for s in samples]
+        self.timeFits = fitModels(sizes, [s[1] for s in samples])
+        self.memoryFits = fitModels(sizes, [s[2] for s in samples], MEMORY_FLOOR)
+
+    @property
+    def time(self):
+        return self.timeFits[0]
+
+    @property
+    def memory(self):
+        return self.memoryFits[0]
+
+    def report(self):
+        runnerUp = self.timeFits[1]
+        lines = [f"{self.name}: time {self.time.label} (c = {self.time.constant:.3g} s), "
+                 f"memory {self.memory.label} (c = {self.memory.constant:.3g} B)",
+                 f"  residual {self.time.residual:.3g}, next {runnerUp.label} {runnerUp.residual:.3g}"]
+        for n, seconds, peak in self.samples:
+            lines.append(f"  n={n:>10,}  {seconds:12.3g} s  peak {peak / 1024:10.1f} KiB")
+        return "\n".join(lines)
+
+
+def _timeCall(fn, data):
+    start = time.perf_counter()
+    fn(data)
+    took = time.perf_counter() - start
+    if took >= MIN_SAMPLE:
+        return took
+    number = int(MIN_SAMPLE / max(took, 1e-9)) + 1
+    start = time.perf_counter()
+    for _ in range(number):
+        fn(data)
+    return (time.perf_counter() - start) / number
+
+
+def profile(fn, gen, sizes=None, repeats=3, name=None):
+    # fn(gen(n)) ovvoru size-kum measure panni Profile return
+    sizes = sizes or geometricSizes()
+    if len(sizes) < 3:
+        raise ValueError("need at least 3 sizes to tell the models apart")
+    samples = []
+    for n in sizes:
+        best = None
+        for _ in range(repeats):
+            took = _timeCall(fn, gen(n))
+            best = took if best is None or took < best else best
+
+        data = gen(n)
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        fn(data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del data
+        samples.append((n, best, peak))
+    return Profile(name or getattr(fn, "__name__", repr(fn)), samples)
+
+
+# _________________________________________________________________________
+# Examples – day1 / day2 array routines (python complexity.py)
+# _________________________________________________________________________
+
+def quadraticPairs(data):
+    # day1.py contrast example (nested loop) – print badhil count
+    count = 0
+    for i in data:
+        for j in data:
+            count += 1
+    return count
+
+
+def _examples():
+    import random
+
+    from bench_arrays import day1TwoPointerReverse, day2MoveZeros
+    from partition import stablePartition
+    from rotation import rotateInPlace, rotateReversal
+
+    def ints(n):
+        return [random.choice((0, 0, random.randrange(1, 100))) for _ in range(n)]
+
+    def floats(n):
+        return [random.random() for _ in range(n)]
+
+    # (expected class, profile) – tool correct-aa class solludha nu check
+    yield "O(1)", profile(len, ints, name="len")
+    yield "O(1)", profile(lambda a: a[len(a) // 2], ints, name="index lookup")
+    yield "O(n)", profile(list, ints, name="list copy")
+    yield "O(n)", profile(day1TwoPointerReverse, ints, name="day1 two pointer reverse")
+    yield "O(n)", profile(lambda a: rotateReversal(a, len(a) // 3), ints, name="rotateReversal")
+    yield "O(n)", profile(lambda a: rotateInPlace(a, 10), ints, name="rotateInPlace k=10 (shift)")
+    yield "O(n)", profile(day2MoveZeros, ints, name="day2 moveZeros")
+    yield "O(n)", profile(stablePartition, ints, name="stablePartition")
+    yield "O(n log n)", profile(sorted, floats, name="sorted")
+    yield "O(n²)", profile(quadraticPairs, ints, geometricSizes(250, 4000), name="day1 nested loop")
+
+
+if __name__ == "__main__":
+    import sys
+
+    wrong = 0
+    for expected, result in _examples():
+        print(result.report())
+        if result.time.label != expected:
+            wrong += 1
+            print(f"  ✗ expected {expected}")
+        print()
+    sys.exit(1 if wrong else 0)
@@ -80,6 +80,18 @@
 # 12 found → swap → [1, 3, 12, 0, 0]
 
 
+# Swap line comment-la irundhadhala mela code edhuvum move pannala.
+# Fixed + generalized version partition.py-la irukku
+# (any predicate – zeros / None / NaN / sentinel, fast path, streaming).
+
+from partition import stablePartition
+
+
+def moveZeros(arr):
+    stablePartition(arr)   # returns kept (non-zero) count
+    return arr
+
+
 
 # Problem:
 # Move all 0s to the end of the array without changing the order of non-zero elements.
@@ -179,20 +191,31 @@ print(rotateArray(arr, k))
 # _________________________________________________________________________
 
 
-def rotateArray(arr, k):
-    n = len(arr)
-    k = k % n   # safety step
+# def rotateArray(arr, k):
+#     n = len(arr)
+#     k = k % n   # safety step
 
-    # Step 1: take last k elements
-    last_part = arr[n - k:]
+#     # Step 1: take last k elements
+#     last_part = arr[n - k:]
 
-    # Step 2: take first n-k elements
-    first_part = arr[:n - k]
+#     # Step 2: take first n-k elements
+#     first_part = arr[:n - k]
 
-    # Step 3: join them
-    arr[:] = last_part + first_part
+#     # Step 3: join them
+#     arr[:] = last_part + first_part
 
-    return arr
+#     return arr
+
+
+# last_part + first_part + join → ~3x array memory, big list-la OOM.
+# Ippo in-place engine (rotation.py) use pannrom, extra memory constant.
+# Slicing version rotation.rotateSlice-la benchmark baseline-aa irukku.
+
+from rotation import rotateInPlace
+
+
+def rotateArray(arr, k, method="auto"):
+    return rotateInPlace(arr, k, method)
 
 
 # # Test
@@ -0,0 +1,412 @@
+# _________________________________________________________________________
+# 🟢 IntHashSet / IntHashMap – compact open addressing for 64-bit ints
+# _________________________________________________________________________
+
+# Problem:
+# Phase 2 hashing (dedup, two-sum joins) 10 crore keys mela. Python set /
+# dict ovvoru int-kum int object (28-32 B) + table entry (16-24 B) →
+# 60-100 B per key.
+
+# Pattern:
+# Hashing – open addressing, linear probing.
+
+# Key logic:
+# * keys (values-um) array('q')-la direct-aa, capacity = power of 2.
+#   Empty slot = EMPTY (int64 min) – andha key-a user kuduthaa separate
+#   flag-la store.
+# * slot = Fibonacci hash: (key * 0x9E3779B97F4A7C15 mod 2^64) >> (64 - bits)
+#   (sequential keys-um spread aagum). Collision → slot + 1 (wrap).
+# * Load > MAX_LOAD → capacity x2, ellaa keys re-insert.
+# * Delete = backward shift (tombstone illa): pinnaadi irukkura cluster
+#   keys-a, avanga home slot cross aagaadha varaikkum munnaadi shift.
+# * Bulk APIs (update / containsMany / putMany / getMany): numpy irundha
+#   ellaa keys-um oru probe round-la vectorized; match / empty aana keys
+#   drop, meedhi slot + 1 – rounds = longest probe chain. Same empty slot-ku
+#   rendu keys race pannina first one mattum ezhudhum, matthadhu next round.
+#   putMany: batch dedup (np.unique) → _bulkFind → pudhu keys count-ku
+#   mattum grow (duplicates table-a perusaakkaadhu). numpy illana Python loop.
+# * bytesPerEntry() = table bytes / len → memory report.
+
+# _________________________________________________________________________
+
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana bulk APIs Python loop
+    np = None
+
+
+EMPTY = -(1 << 63)
+MAX_LOAD = 0.6
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _int64(items):
+    # list / array / ndarray → asarray; generator (len illa) → fromiter
+    if hasattr(items, "__len__"):
+        return np.asarray(items, dtype=np.int64)
+    return np.fromiter(items, dtype=np.int64)
+
+
+def _capacityFor(n):
+    cap = 8
+    while n > cap * MAX_LOAD:
+        cap *= 2
+    return cap
+
+
+class IntHashSet:
+    _HAS_VALUES = False
+
+    def __init__(self, keys=None, capacity=8):
+        self._setup(_capacityFor(capacity * MAX_LOAD))
+        self._hasEmptyKey = False
+        self._emptyValue = 0
+        if keys is not None:
+            self.update(keys)
+
+    def _setup(self, capacity):
+        self._bits = capacity.bit_length() - 1
+        self._mask = capacity - 1
+        self._keys = array("q", [EMPTY]) * capacity
+        self._values = array("q", [0]) * capacity if self._HAS_VALUES else None
+        self._used = 0      # table-la irukkura keys (EMPTY key count illa)
+
+    def _home(self, key):
+        return ((key * _GOLDEN) & _MASK64) >> (64 - self._bits)
+
+    def _find(self, key):
+        # key-oda slot, illana adhu poga vendiya empty slot (-1 - slot)
+        keys, mask = self._keys, self._mask
+        i = self._home(key)
+        while True:
+            k = keys[i]
+            if k == key:
+                return i
+            if k == EMPTY:
+                return -1 - i
+            i = (i + 1) & mask
+
+    def _grow(self, extra=1):
+        if self._used + extra <= len(self._keys) * MAX_LOAD:
+            return
+        oldKeys, oldValues = self._keys, self._values
+        self._setup(_capacityFor(self._used + extra))
+        if np is not None:
+            keys = np.frombuffer(oldKeys, dtype=np.int64)
+            live = keys != EMPTY
+            values = np.frombuffer(oldValues, dtype=np.int64)[live] if oldValues is not None else None
+            self._bulkInsert(keys[live], values)
+            return
+        for t, k in enumerate(oldKeys):
+            if k != EMPTY:
+                i = -1 - self._find(k)
+                self._keys[i] = k
+                if oldValues is not None:
+                    self._values[i] = oldValues[t]
+                self._used += 1
+
+    # ___________________________ single-key API ____________________________
+
+    def __len__(self):
+        return self._used + self._hasEmptyKey
+
+    def __contains__(self, key):
+        if key == EMPTY:
+            return self._hasEmptyKey
+        return self._find(key) >= 0
+
+    def add(self, key):
+        self._put(key, 0)
+
+    def _put(self, key, value):
+        if key == EMPTY:
+            self._hasEmptyKey = True
+            self._emptyValue = value
+            return
+        i = self._find(key)
+        if i < 0:
+            self._grow()
+            i = -1 - self._find(key)
+            self._keys[i] = key
+            self._used += 1
+        if self._values is not None:
+            self._values[i] = value
+
+    def discard(self, key):
+        if key == EMPTY:
+            self._hasEmptyKey = False
+            return
+        i = self._find(key)
+        if i < 0:
+            return
+        keys, values, mask = self._keys, self._values, self._mask
+        j = i
+        while True:                 # backward shift delete
+            j = (j + 1) & mask
+            k = keys[j]
+            if k == EMPTY:
+                break
+            home = self._home(k)
+            # k-oda home (i, j] range-ku veliya irundha i-ku move pannalam
+            if (home <= i < j) or (j < home <= i) or (i < j < home):
+                keys[i] = k
+                if values is not None:
+                    values[i] = values[j]
+                i = j
+        keys[i] = EMPTY
+        self._used -= 1
+
+    def __iter__(self):
+        if self._hasEmptyKey:
+            yield EMPTY
+        for k in self._keys:
+            if k != EMPTY:
+                yield k
+
+    # ______________________________ bulk API _______________________________
+
+    def _homes(self, keys):
+        h = keys.view(np.uint64) * np.uint64(_GOLDEN)      # mod 2^64 wrap
+        return (h >> np.uint64(64 - self._bits)).astype(np.intp)
+
+    def _bulkInsert(self, keys, values):
+        # keys: unique int64 ndarray, EMPTY illa
+        table = np.frombuffer(self._keys, dtype=np.int64)
+        vtable = np.frombuffer(self._values, dtype=np.int64) if values is not None else None
+        slots = self._homes(keys)
+        mask = self._mask
+        added = 0
+        while len(keys):
+            cur = table[slots]
+            hit = cur == keys
+            if vtable is not None and hit.any():
+                vtable[slots[hit]] = values[hit]
+            empty = cur == EMPTY
+            # same empty slot-ku pala keys → first mattum
+            emptyIdx = np.flatnonzero(empty)
+            _, firstOfSlot = np.unique(slots[emptyIdx], return_index=True)
+            winners = emptyIdx[firstOfSlot]
+            table[slots[winners]] = keys[winners]
+            if vtable is not None:
+                vtable[slots[winners]] = values[winners]
+            added += len(winners)
+            done = hit.copy()
+            done[winners] = True
+            move = ~(hit | empty)               # vera key irukku → next slot
+            slots[move] = (slots[move] + 1) & mask
+            keep = ~done
+            keys, slots = keys[keep], slots[keep]
+            if values is not None:
+                values = values[keep]
+        self._used += added
+
+    def _bulkFind(self, keys):
+        # ovvoru key-kum slot, illana -1
+        table = np.frombuffer(self._keys, dtype=np.int64)
+        result = np.full(len(keys), -1, dtype=np.intp)
+        pending = np.flatnonzero(keys != EMPTY)
+        slots = self._homes(keys[pending])
+        mask = self._mask
+        while len(pending):
+            cur = table[slots]
+            hit = cur == keys[pending]
+            result[pending[hit]] = slots[hit]
+            go = ~(hit | (cur == EMPTY))
+            pending, slots = pending[go], (slots[go] + 1) & mask
+        return result
+
+    def update(self, keys):
+        self.putMany(keys, None)
+
+    def putMany(self, keys, values):
+        if np is None:
+            for k, v in zip(keys, values if values is not None else repeat(0)):
+                self._put(k, v)
+            return
+        keys = _int64(keys)
+        values = None if values is None or not self._HAS_VALUES else _int64(values)
+        special = keys == EMPTY
+        if special.any():
+            self._hasEmptyKey = True
+            if values is not None:
+                self._emptyValue = int(values[special][-1])
+                values = values[~special]
+            keys = keys[~special]
+        # batch-kulla duplicates → last value
+        if values is not None:
+            rev = slice(None, None, -1)
+            keys, first = np.unique(keys[rev], return_index=True)
+            values = values[rev][first]
+        else:
+            keys = np.unique(keys)
+        # already irukkura keys → value update mattum; pudhu keys count-ku grow
+        slots = self._bulkFind(keys)
+        old = slots >= 0
+        if old.any():
+            if values is not None:
+                np.frombuffer(self._values, dtype=np.int64)[slots[old]] = values[old]
+                values = values[~old]
+            keys = keys[~old]
+        self._grow(len(keys))
+        self._bulkInsert(keys, values)
+
+    def containsMany(self, keys):
+        if np is None:
+            return [k in self for k in keys]
+        keys = _int64(keys)
+        found = self._bulkFind(keys) >= 0
+        if self._hasEmptyKey:
+            found |= keys == EMPTY
+        return found
+
+    # ______________________________ memory _________________________________
+
+    @property
+    def nbytes(self):
+        total = self._keys.itemsize * len(self._keys)
+        if self._values is not None:
+            total += self._values.itemsize * len(self._values)
+        return total
+
+    def bytesPerEntry(self):
+        return self.nbytes / max(1, len(self))
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(len={len(self)}, capacity={len(self._keys)}, "
+                f"{self.bytesPerEntry():.1f} B/entry)")
+
+
+class IntHashMap(IntHashSet):
+    # int64 → int64
+    _HAS_VALUES = True
+
+    def __init__(self, items=(), capacity=8):
+        super().__init__(capacity=capacity)
+        items = list(items.items() if hasattr(items, "items") else items)
+        if items:
+            self.putMany([k for k, _ in items], [v for _, v in items])
+
+    def __setitem__(self, key, value):
+        self._put(key, value)
+
+    def __getitem__(self, key):
+        if key == EMPTY:
+            if self._hasEmptyKey:
+                return self._emptyValue
+            raise KeyError(key)
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def add(self, key):
+        raise TypeError("IntHashMap needs a value: use map[key] = value")
+
+    def getMany(self, keys, default=0):
+        if np is None:
+            return [self.get(k, default) for k in keys]
+        keys = _int64(keys)
+        slots = self._bulkFind(keys)
+        out = np.full(len(keys), default, dtype=np.int64)
+        hit = slots >= 0
+        out[hit] = np.frombuffer(self._values, dtype=np.int64)[slots[hit]]
+        if self._hasEmptyKey:
+            out[keys == EMPTY] = self._emptyValue
+        return out
+
+    def items(self):
+        if self._hasEmptyKey:
+            yield EMPTY, self._emptyValue
+        for k, v in zip(self._keys, self._values):
+            if k != EMPTY:
+                yield k, v
+
+
+# _________________________________________________________________________
+# Benchmark (python int_hash.py)
+# _________________________________________________________________________
+
+def _bench(n=10**6):
+    import random
+    import time
+    import tracemalloc
+
+    keys = array("q", random.sample(range(-10**12, 10**12), n))
+    queries = array("q", random.sample(keys.tolist(), n // 2)) + array("q", range(n // 2))
+
+    def measure(build):
+        tracemalloc.start()
+        start = time.perf_counter()
+        obj = build()
+        took = time.perf_counter() - start
+        mem = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return obj, took, mem
+
+    s, tSet, mSet = measure(lambda: set(keys))
+    h, tHash, mHash = measure(lambda: IntHashSet(keys))
+    start = time.perf_counter()
+    a = [q in s for q in queries]
+    qSet = time.perf_counter() - start
+    start = time.perf_counter()
+    b = h.containsMany(queries)
+    qBulk = time.perf_counter() - start
+    start = time.perf_counter()
+    c = [q in h for q in queries[:100000]]
+    qOne = (time.perf_counter() - start) * len(queries) / 100000
+    assert list(a) == list(b) and c == a[:100000]
+    print(f"n={n:,}  set: build {tSet:6.3f} s  {mSet / n:5.1f} B/key  lookup {qSet:6.3f} s")
+    print(f"{'':>{len(f'n={n:,}')}}  IntHashSet: build {tHash:6.3f} s  {mHash / n:5.1f} B/key"
+          f"  containsMany {qBulk:6.3f} s  `in` loop {qOne:6.3f} s")
+
+    values = array("q", range(n))
+    d, tDict, mDict = measure(lambda: dict(zip(keys, values)))
+    m, tMap, mMap = measure(lambda: IntHashMap(zip(keys, values)))
+    start = time.perf_counter()
+    a = [d.get(q, -1) for q in queries]
+    qDict = time.perf_counter() - start
+    start = time.perf_counter()
+    b = m.getMany(queries, -1)
+    qMap = time.perf_counter() - start
+    assert list(a) == list(b)
+    print(f"n={n:,} dict: build {tDict:6.3f} s  {mDict / n:5.1f} B/key  lookup {qDict:6.3f} s")
+    print(f"{'':>{len(f'n={n:,}')}}  IntHashMap: build {tMap:6.3f} s  {mMap / n:5.1f} B/key"
+          f"  getMany {qMap:6.3f} s")
+
+
+# Numbers (CPython 3.11, NumPy 2.x, n = 10 lakh random int64 keys,
+# 10 lakh queries – half hit, half miss):
+#
+#                  build      memory      lookup (bulk)   lookup (`in` loop)
+# set             0.56 s    65.6 B/key       0.23 s             –
+# IntHashSet      1.00 s    16.8 B/key       0.09 s           0.73 s
+# dict            1.29 s   105.9 B/key       0.40 s             –
+# IntHashMap      3.02 s    33.7 B/key       0.08 s             –
+#
+# 👉 memory ~4x kammi (int objects illa, 8 B slot, load <= 0.6)
+# 👉 bulk lookup numpy probe rounds-la → set `in` loop-a vida ~2.5x fast;
+#    oru oru key-aa `in` Python probing → ~3x slow, adhanaala bulk API use pannunga
+# 👉 IntHashMap build slow-ku kaaranam zip(keys, values) Python pairs;
+#    putMany(keys, values) direct-aa kuduthaa 0.48 s (vectorized)
+
+
+if __name__ == "__main__":
+    s = IntHashSet([3, 7, 7, -1, EMPTY])
+    print(s, sorted(s), 7 in s, 8 in s)
+    s.discard(7)
+    print(sorted(s), [bool(x) for x in s.containsMany([3, 7, EMPTY])])
+
+    m = IntHashMap({1: 10, 2: 20})
+    m[3] = 30
+    print(m[2], m.get(9, -1), [int(x) for x in m.getMany([1, 3, 9], -1)])
+    _bench()
@@ -0,0 +1,217 @@
+# _________________________________________________________________________
+# 🟢 Kadane – maximum subarray sum (streaming + parallel)
+# _________________________________________________________________________
+
+# Problem:
+# Sensor stream-la contiguous readings-oda maximum sum edhu, adhu
+# enga start / end aagudhu nu venum. Stream full-aa memory-la illa.
+
+# Pattern:
+# Kadane (running sum, negative aana restart) + divide & conquer summaries.
+
+# Key logic:
+# cur = ippo mudiyra subarray-oda best sum
+#   cur < 0  → pazhaya part burden, x-la irundhu restart
+#   illana   → cur + x (extend)
+# best = cur > best aana mattum update (strictly greater).
+# Ties: same sum irundha earliest end, adhukulla earliest start
+# (cur == 0 na restart illa → start munnaadi irukkum).
+# Result = (sum, lo, hi) → arr[lo:hi] dhaan andha subarray.
+
+# Parallel:
+# Ovvoru chunk-um (total, best prefix, best suffix, best) summary.
+#   merged.total  = L.total + R.total
+#   merged.prefix = max(L.prefix, L.total + R.prefix)
+#   merged.suffix = max(R.suffix, L.suffix + R.total)
+#   merged.best   = max(L.best, L.suffix + R.prefix, R.best)
+# Adhe tie rules merge-la (earliest end, then earliest start) → ints-ku
+# single pass result-um parallel result-um exact-aa same.
+# Floats-la addition order maarum, so last bits maaralam.
+
+# _________________________________________________________________________
+
+import os
+from itertools import islice
+from multiprocessing import Pool
+
+
+CHUNK = 1 << 16     # streams-ku (len theriyaadhu) items per worker task
+
+
+class KadaneState:
+    # incremental Kadane: push / extend pannitte irukkalam, result() eppo venaalum
+
+    def __init__(self):
+        self.count = 0
+        self._cur = 0
+        self._curLo = 0
+        self._best = None
+        self._bestLo = 0
+        self._bestHi = 0
+
+    def push(self, x):
+        self.extend((x,))
+
+    def extend(self, iterable):
+        i = self.count
+        cur, curLo = self._cur, self._curLo
+        best, bestLo, bestHi = self._best, self._bestLo, self._bestHi
+        for x in iterable:
+            if i == 0 or cur < 0:
+                cur, curLo = x, i
+            else:
+                cur += x
+            i += 1
+            if best is None or cur > best:
+                best, bestLo, bestHi = cur, curLo, i
+        self.count = i
+        self._cur, self._curLo = cur, curLo
+        self._best, self._bestLo, self._bestHi = best, bestLo, bestHi
+        return self
+
+    def result(self):
+        if self.count == 0:
+            raise ValueError("max subarray of empty input")
+        return self._best, self._bestLo, self._bestHi
+
+
+def maxSubarray(iterable):
+    # single pass; return (sum, lo, hi) → subarray = arr[lo:hi]
+    return KadaneState().extend(iterable).result()
+
+
+# _________________________________________________________________________
+# Divide & conquer summaries
+# _________________________________________________________________________
+
+class Summary:
+    # one segment [lo, hi): total, best prefix (end), best suffix (start), best
+
+    __slots__ = ("lo", "hi", "total", "prefix", "prefixEnd",
+                 "suffix", "suffixStart", "best", "bestLo", "bestHi")
+
+    def __init__(self, lo, hi, total, prefix, prefixEnd, suffix, suffixStart,
+                 best, bestLo, bestHi):
+        self.lo, self.hi, self.total = lo, hi, total
+        self.prefix, self.prefixEnd = prefix, prefixEnd
+        self.suffix, self.suffixStart = suffix, suffixStart
+        self.best, self.bestLo, self.bestHi = best, bestLo, bestHi
+
+    @classmethod
+    def of(cls, chunk, lo=0):
+        # one pass over a chunk (iterator-um ok); absolute indices lo-la irundhu
+        running = 0
+        prefix = minBefore = best = None
+        prefixEnd = suffixStart = bestLo = bestHi = 0
+        cur, curLo = 0, lo
+        i = lo
+        for x in chunk:
+            if minBefore is None or running < minBefore:
+                minBefore, suffixStart = running, i   # suffix = total - minBefore
+            if i == lo or cur < 0:                    # Kadane, adhe loop-la
+                cur, curLo = x, i
+            else:
+                cur += x
+            running += x
+            i += 1
+            if prefix is None or running > prefix:
+                prefix, prefixEnd = running, i
+            if best is None or cur > best:
+                best, bestLo, bestHi = cur, curLo, i
+        if i == lo:
+            raise ValueError("summary of empty chunk")
+        return cls(lo, i, running, prefix, prefixEnd, running - minBefore, suffixStart,
+                   best, bestLo, bestHi)
+
+    def merge(self, right):
+        # self = left neighbour, right = adutha segment
+        if right.lo != self.hi:
+            raise ValueError("summaries must be adjacent")
+        left = self
+
+        prefix, prefixEnd = left.prefix, left.prefixEnd
+        if left.total + right.prefix > prefix:                # later end → strictly
+            prefix, prefixEnd = left.total + right.prefix, right.prefixEnd
+
+        suffix, suffixStart = right.suffix, right.suffixStart
+        if left.suffix + right.total >= suffix:               # earlier start → ties ok
+            suffix, suffixStart = left.suffix + right.total, left.suffixStart
+
+        # key (-sum, end, start) smallest = Kadane tie rule
+        best = min(
+            (left.best, left.bestLo, left.bestHi),
+            (left.suffix + right.prefix, left.suffixStart, right.prefixEnd),
+            (right.best, right.bestLo, right.bestHi),
+            key=lambda c: (-c[0], c[2], c[1]),
+        )
+        return Summary(left.lo, right.hi, left.total + right.total, prefix, prefixEnd,
+                       suffix, suffixStart, *best)
+
+    def result(self):
+        return self.best, self.bestLo, self.bestHi
+
+
+def reduceSummaries(summaries):
+    # reduction tree: pairs merge, round by round (log2(chunks) levels)
+    level = list(summaries)
+    if not level:
+        raise ValueError("max subarray of empty input")
+    while len(level) > 1:
+        merged = [level[i].merge(level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            merged.append(level[-1])
+        level = merged
+    return level[0]
+
+
+def _summarize(task):
+    lo, chunk = task
+    return Summary.of(chunk, lo)
+
+
+def _chunks(data, chunkSize):
+    # (start index, chunk list) – iterator-a chunkSize varaikkum mattum padikkum
+    it = iter(data)
+    lo = 0
+    while True:
+        chunk = list(islice(it, chunkSize))
+        if not chunk:
+            return
+        yield lo, chunk
+        lo += len(chunk)
+
+
+def parallelMaxSubarray(data, workers=None, chunkSize=None, pool=None):
+    # worker processes chunk summaries; result maxSubarray(data) maadhiri
+    workers = workers or os.cpu_count() or 1
+    if chunkSize is None:
+        try:
+            chunkSize = max(1, -(-len(data) // (workers * 4)))
+        except TypeError:       # generator / stream
+            chunkSize = CHUNK
+    ownPool = pool is None
+    if ownPool:
+        pool = Pool(workers)
+    try:
+        summaries = list(pool.imap(_summarize, _chunks(data, chunkSize)))
+    finally:
+        if ownPool:
+            pool.close()
+            pool.join()
+    return reduceSummaries(summaries).result()
+
+
+if __name__ == "__main__":
+    arr = [-2, 1, -3, 4, -1, 2, 1, -5, 4]
+    best, lo, hi = maxSubarray(arr)
+    print(best, lo, hi, arr[lo:hi])                    # 6 3 7 [4, -1, 2, 1]
+
+    readings = (x for x in [3, -4, 2, 2, -1, 5, -9, 1])
+    print(maxSubarray(readings))
+
+    state = KadaneState()
+    for x in [-3, -1, -2]:
+        state.push(x)
+    print(state.result())                              # all negative → (-1, 1, 2)
+
+    print(parallelMaxSubarray(arr, workers=2, chunkSize=2))
@@ -0,0 +1,263 @@
+# _________________________________________________________________________
+# 🟢 Matrix Rotation – 90 / 180 / 270 degree (image tiles)
+# _________________________________________________________________________
+
+# Problem:
+# rotateArray 1-D mattum. Image tiles (square / rectangle) 90° rotate
+# pannanum; naive out[j][n-1-i] = m[i][j] loop periya matrix-la cache
+# miss ellaa element-kum.
+
+# Pattern:
+# Transpose + reverse (index manipulation) + tiling (cache blocking).
+
+# Key logic (clockwise):
+# *  90° = transpose, apram ovvoru row reverse
+#    [[1, 2],      transpose   [[1, 3],    row reverse   [[3, 1],
+#     [3, 4]]      ───────→     [2, 4]]    ─────────→     [4, 2]]
+# * 270° = transpose, apram rows order reverse (TILE rows blocks swap,
+#   top block ↔ bottom block reversed)
+# * 180° = rows order reverse + ovvoru row reverse (transpose illa) –
+#   adhe TILE rows block swap, swap pannumbodhe [::-1, ::-1].
+# * Square → in place. Transpose TILE x TILE blocks-aa: tile (a, c)
+#   tile (c, a)-oda swap (transposed), diagonal tiles own transpose.
+#   Rendu tiles-um cache-la irukkum bodhe ellaa swaps-um mudiyum.
+# * Rectangle (rows != cols) → shape maarum, in place mudiyaadhu →
+#   out-of-place, out kuduthaa adhula (preallocated, allocation illa),
+#   TILE x TILE blocks-aa copy.
+# Nested lists: row.reverse() / list.reverse() C-level; transpose tiled
+# swaps (Python), rectangle → zip rows.
+
+# _________________________________________________________________________
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana nested-list path mattum
+    np = None
+
+
+TILE = 64           # ndarray tile (64 x 64 int64 = 32 KiB, L1-la fit)
+LIST_TILE = 32
+
+
+def _turns(degrees):
+    if degrees % 90:
+        raise ValueError(f"degrees must be a multiple of 90, got {degrees}")
+    return degrees // 90 % 4
+
+
+# _________________________________________________________________________
+# ndarray backend
+# _________________________________________________________________________
+
+def _transposeSquareNumpy(m):
+    n = m.shape[0]
+    for a in range(0, n, TILE):
+        b = min(n, a + TILE)
+        diag = m[a:b, a:b]
+        diag[...] = diag.T.copy()
+        for c in range(b, n, TILE):
+            d = min(n, c + TILE)
+            upper = m[a:b, c:d].copy()
+            m[a:b, c:d] = m[c:d, a:b].T
+            m[c:d, a:b] = upper.T
+
+
+def _reverseRowsNumpy(m):
+    # ovvoru row-um reverse, TILE rows oru thadava (temp = TILE rows mattum)
+    for a in range(0, m.shape[0], TILE):
+        block = m[a:a + TILE]
+        block[...] = block[:, ::-1].copy()
+
+
+def _reverseOrderNumpy(m, flipRows=False):
+    # rows order reverse: top TILE rows block ↔ bottom block (reversed),
+    # temp = oru tile of rows mattum. flipRows → ovvoru row-um reverse (180°)
+    n = m.shape[0]
+    half = n // 2
+    cols = slice(None, None, -1 if flipRows else 1)
+    for a in range(0, half, TILE):
+        b = min(half, a + TILE)
+        top = m[a:b].copy()
+        m[a:b] = m[n - b:n - a][::-1, cols]
+        m[n - b:n - a] = top[::-1, cols]
+    if flipRows and n % 2:
+        m[half] = m[half][::-1].copy()
+
+
+def _rotateSquareNumpy(m, turns):
+    if turns == 2:
+        _reverseOrderNumpy(m, flipRows=True)
+        return m
+    _transposeSquareNumpy(m)
+    if turns == 1:
+        _reverseRowsNumpy(m)
+    else:
+        _reverseOrderNumpy(m)
+    return m
+
+
+def _rotateIntoNumpy(m, turns, out):
+    view = np.rot90(m, -turns)              # strided view, copy illa
+    rows, cols = view.shape
+    for a in range(0, rows, TILE):
+        for c in range(0, cols, TILE):
+            out[a:a + TILE, c:c + TILE] = view[a:a + TILE, c:c + TILE]
+    return out
+
+
+# _________________________________________________________________________
+# nested-list backend
+# _________________________________________________________________________
+
+def _transposeSquareList(m):
+    n = len(m)
+    for a in range(0, n, LIST_TILE):
+        for c in range(a, n, LIST_TILE):
+            for i in range(a, min(n, a + LIST_TILE)):
+                row = m[i]
+                for j in range(max(c, i + 1), min(n, c + LIST_TILE)):
+                    row[j], m[j][i] = m[j][i], row[j]
+
+
+def _rotateSquareList(m, turns):
+    if turns == 2:
+        m.reverse()
+        for row in m:
+            row.reverse()
+        return m
+    _transposeSquareList(m)
+    if turns == 1:
+        for row in m:
+            row.reverse()
+    else:
+        m.reverse()
+    return m
+
+
+def _rotateIntoList(m, turns, out):
+    if turns == 0:
+        rows = m
+    elif turns == 1:
+        rows = zip(*m[::-1])
+    elif turns == 2:
+        rows = (row[::-1] for row in reversed(m))
+    else:
+        rows = reversed(list(zip(*m)))
+    for target, row in zip(out, rows):
+        target[:] = row
+    return out
+
+
+# _________________________________________________________________________
+# public API
+# _________________________________________________________________________
+
+def rotatedShape(shape, degrees=90):
+    rows, cols = shape
+    return (cols, rows) if _turns(degrees) % 2 else (rows, cols)
+
+
+def rotateMatrix(matrix, degrees=90, out=None):
+    # clockwise rotate. Square + out=None → in place (same object return);
+    # rectangle → out (illana pudhu matrix) -la result.
+    turns = _turns(degrees)
+    isNumpy = np is not None and isinstance(matrix, np.ndarray)
+    if isNumpy:
+        if matrix.ndim != 2:
+            raise ValueError(f"expected a 2-D array, got {matrix.ndim}-D")
+        rows, cols = matrix.shape
+    else:
+        rows = len(matrix)
+        cols = len(matrix[0]) if rows else 0
+        if any(len(row) != cols for row in matrix):
+            raise ValueError("ragged nested list – all rows need the same length")
+
+    shape = rotatedShape((rows, cols), degrees)
+    if out is None and rows == cols:
+        if turns == 0 or rows == 0:
+            return matrix
+        return _rotateSquareNumpy(matrix, turns) if isNumpy else _rotateSquareList(matrix, turns)
+
+    if out is None:
+        out = np.empty(shape, dtype=matrix.dtype) if isNumpy else [[None] * shape[1] for _ in range(shape[0])]
+    else:
+        outShape = out.shape if hasattr(out, "shape") else (len(out), len(out[0]) if len(out) else 0)
+        if tuple(outShape) != shape:
+            raise ValueError(f"out has shape {tuple(outShape)}, expected {shape}")
+    if isNumpy:
+        return _rotateIntoNumpy(matrix, turns, out)
+    return _rotateIntoList(matrix, turns, out)
+
+
+# _________________________________________________________________________
+# Benchmark (python matrix_rotate.py)
+# _________________________________________________________________________
+
+def _naiveRotate(m):
+    # index loop: out[j][n-1-i] = m[i][j]
+    rows, cols = len(m), len(m[0])
+    out = [[None] * rows for _ in range(cols)]
+    for i in range(rows):
+        for j in range(cols):
+            out[j][rows - 1 - i] = m[i][j]
+    return out
+
+
+def _bench(sizes=(256, 1024, 4096), repeats=3):
+    import time
+
+    def best(fn, setup):
+        times = []
+        for _ in range(repeats):
+            data = setup()
+            start = time.perf_counter()
+            fn(data)
+            times.append(time.perf_counter() - start)
+        return min(times) * 1000
+
+    for n in sizes:
+        if n <= 1024:
+            nested = lambda: [list(range(r * n, (r + 1) * n)) for r in range(n)]
+            naive = best(_naiveRotate, nested)
+            inPlace = best(rotateMatrix, nested)
+            print(f"list    n={n:>5}: naive loop {naive:9.2f} ms  in place {inPlace:9.2f} ms")
+        if np is None:
+            continue
+        square = lambda: np.arange(n * n, dtype=np.int64).reshape(n, n)
+        wide = np.arange(n * (n // 2), dtype=np.int64).reshape(n // 2, n)
+        buf = np.empty((n, n // 2), dtype=np.int64)
+        line = f"ndarray n={n:>5}:"
+        if n <= 1024:
+            line += f" naive loop {best(_naiveRotate, square):9.2f} ms "
+        line += (f" rot90 copy {best(lambda m: np.ascontiguousarray(np.rot90(m, -1)), square):8.2f} ms"
+                 f"  in place {best(rotateMatrix, square):8.2f} ms"
+                 f"  180° {best(lambda m: rotateMatrix(m, 180), square):8.2f} ms"
+                 f"  270° {best(lambda m: rotateMatrix(m, 270), square):8.2f} ms"
+                 f"  rect out= {best(lambda m: rotateMatrix(m, 90, out=buf), lambda: wide):8.2f} ms"
+                 f"  rect copyto {best(lambda m: np.copyto(buf, np.rot90(m, -1)), lambda: wide):8.2f} ms")
+        print(line)
+
+
+# Numbers (CPython 3.11, NumPy 2.x, int64, best of 3; in place = 90°):
+#
+#                     naive loop   rot90 copy   in place     180°       270°    rect out=   rect copyto
+# list     256 x 256     4.78 ms        –          4.03 ms      –          –          –            –
+# list    1024 x 1024  154.77 ms        –        110.76 ms      –          –          –            –
+# ndarray  256 x 256    22.58 ms     0.11 ms      0.19 ms    0.06 ms    0.16 ms    0.07 ms      0.05 ms
+# ndarray 1024 x 1024  395.01 ms     6.64 ms      4.35 ms    1.27 ms    2.93 ms    1.35 ms      3.41 ms
+# ndarray 4096 x 4096       –      241.30 ms     93.89 ms   29.74 ms   73.18 ms   31.09 ms     92.22 ms
+#
+# (rect = n/2 x n input → n x n/2 out)
+# 👉 chinna matrix cache-la fit aagum, tiling-ku laabam illa; 4096-la
+#    strided rot90 copy-a vida tiled in place ~2.6x, tiled out= ~7.8x fast
+# 👉 180° / 270° rows order: TILE rows block swaps (temp = oru tile).
+#    Munnaadi full-row records-a reverseBuffer-la reverse pannom → 270°
+#    4096-la ~3.6 s; ippo 90°-a vida kammi
+# 👉 list path Python swaps – naive-a vida konjam dhaan fast, aana extra memory illa
+
+
+if __name__ == "__main__":
+    m = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    print(rotateMatrix(m))                      # [[7, 4, 1], [8, 5, 2], [9, 6, 3]]
+    print(rotateMatrix([[1, 2, 3], [4, 5, 6]], 270))
+    _bench()
@@ -0,0 +1,78 @@
+# _________________________________________________________________________
+# 🟢 File Rotation – RAM-ku periya binary file-a mmap vazhiya rotate pannradhu
+# _________________________________________________________________________
+
+# Problem:
+# int64 array file RAM-a vida periyadhu. list-la load panni rotateArray
+# call pannave mudiyaadhu.
+
+# Pattern:
+# Reverse technique (triple reversal) + mmap + block processing.
+
+# Key logic:
+# File = n records (recordSize bytes each, default 8 = int64).
+# Right rotate by k = reverse all, reverse first k, reverse remaining –
+# record order mattum maarum, record-kulla bytes maaraadhu.
+# Reverse range = rendu ends-la irundhu blockRecords records padichu,
+# block-kulla records reverse panni, swap panni ezhudhradhu
+# (reverse_kernel.reverseMapped – one scratch block, per step allocation illa).
+# So access pattern = rendu sequential streams (front → middle, back → middle).
+# Process panna pages flush + MADV_DONTNEED → resident memory bounded.
+
+# Mistake I made:
+# File size recordSize-ku multiple illana last record udanjidum – check first.
+
+# _________________________________________________________________________
+
+import mmap
+import os
+
+from reverse_kernel import reverseMapped
+
+
+BLOCK_RECORDS = 1 << 16     # records per block (int64 → 512 KiB)
+
+
+def rotateFile(path, k, recordSize=8, blockRecords=BLOCK_RECORDS):
+    # file-la irukkura records-a right rotate by k (in-place, file-laye)
+    if recordSize <= 0 or blockRecords <= 0:
+        raise ValueError("recordSize and blockRecords must be positive")
+    size = os.path.getsize(path)
+    if size % recordSize:
+        raise ValueError(
+            f"{path}: size {size} is not a multiple of recordSize {recordSize}"
+        )
+    n = size // recordSize
+    if n == 0:
+        return 0
+    k = k % n
+    if k == 0:
+        return 0
+
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        blockBytes = blockRecords * recordSize
+        with memoryview(mm) as view:
+            reverseMapped(mm, view, 0, n, recordSize, blockBytes)
+            reverseMapped(mm, view, 0, k, recordSize, blockBytes)
+            reverseMapped(mm, view, k, n, recordSize, blockBytes)
+        mm.flush()
+    return k
+
+
+if __name__ == "__main__":
+    import tempfile
+    from array import array
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "data.bin")
+        with open(path, "wb") as f:
+            array("q", [1, 2, 3, 4, 5]).tofile(f)
+
+        rotateFile(path, 2)
+
+        result = array("q")
+        with open(path, "rb") as f:
+            result.fromfile(f, 5)
+        print(result.tolist())
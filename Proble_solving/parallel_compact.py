@@ -0,0 +1,192 @@
+# _________________________________________________________________________
+# 🟢 Parallel moveZeros – multi-process compaction over shared memory
+# _________________________________________________________________________
+
+# Problem:
+# Hundreds of millions elements-la single process moveZeros dhaan bottleneck.
+
+# Pattern:
+# Local compact + count → exclusive prefix sum → gather (in-place stream compaction).
+
+# Key logic:
+# Buffer = caller-oda shared_memory segment (oru copy mattum, in place).
+# 1. Array-a chunks-aa split pannrom. Ovvoru worker process-um thannoda
+#    chunk-kulla non-zeros-a chunk front-ku compact panni count return pannum
+#    (chunks overlap illa → parallel safe).
+# 2. Exclusive prefix sum of counts = ovvoru chunk output-la enga start
+#    aaganum nu (offset).
+#    counts  = [3, 0, 2, 4]
+#    offsets = [0, 3, 3, 5]
+# 3. Parent left to right ovvoru chunk-oda compacted part-a offset-ku
+#    memmove (offset <= chunk start, munnaadi chunks already move aayiduchu
+#    → overwrite illa). Chunk order + chunk-kulla order same → stable.
+# 4. Total kept-ku apram irukkura tail = zeros.
+# Step 3 serial memmove (kept items mattum); step 1 dhaan parallel.
+# Data already shared segment-la illana parallelMoveZeros oru segment-ku
+# copy panni thirumba copy pannum (2x memory) – hot path-la compactShared.
+# numpy irundha worker kernels vectorized, illana memoryview + comprehension.
+
+# _________________________________________________________________________
+
+import os
+from array import array
+from multiprocessing import Pool, resource_tracker, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana memoryview path
+    np = None
+
+
+CHUNKS_PER_WORKER = 4
+ZERO_CHUNK = 1 << 20    # bytes per tail fill write
+
+
+def makePool(workers=None):
+    # resource tracker pool-ku munnaadi start aaganum – appo dhaan workers
+    # adhe tracker share pannuvaanga (illana worker exit-la segment unlink
+    # aagi "leaked shared_memory" warnings varum). Own pool venum na idha use pannunga.
+    resource_tracker.ensure_running()
+    return Pool(workers or os.cpu_count() or 1)
+
+
+def _view(buf, typecode, n):
+    if np is not None:
+        return np.frombuffer(buf, dtype=typecode, count=n)
+    return buf[:n * array(typecode).itemsize].cast(typecode)
+
+
+def _compactKernel(view, typecode, lo, hi):
+    # separate function → chunk views return-la release aagum (close safe)
+    if np is not None:
+        chunk = view[lo:hi]
+        kept = chunk[chunk != 0]
+        chunk[:len(kept)] = kept
+    else:
+        kept = array(typecode, [x for x in view[lo:hi].tolist() if x])
+        view[lo:lo + len(kept)] = memoryview(kept)
+    return len(kept)
+
+
+def _compactChunk(task):
+    name, typecode, n, lo, hi = task
+    shm = shared_memory.SharedMemory(name=name)
+    view = _view(shm.buf, typecode, n)
+    try:
+        return _compactKernel(view, typecode, lo, hi)
+    finally:
+        del view
+        shm.close()
+
+
+def _gather(view, bounds, counts):
+    # chunk fronts-a offsets-ku left to right; return total kept
+    total = 0
+    for (lo, _), c in zip(bounds, counts):
+        if c and lo != total:
+            view[total:total + c] = view[lo:lo + c]     # overlap-safe memmove
+        total += c
+    return total
+
+
+def _chunkBounds(n, chunks):
+    step = -(-n // chunks) if n else 1
+    return [(lo, min(n, lo + step)) for lo in range(0, n, step)]
+
+
+def compactShared(name, n, typecode="q", workers=None, pool=None):
+    # caller-oda shared buffer-la in-place moveZeros; return kept count
+    workers = workers or os.cpu_count() or 1
+    bounds = _chunkBounds(n, workers * CHUNKS_PER_WORKER)
+    ownPool = pool is None
+    if ownPool:
+        pool = makePool(workers)
+    try:
+        counts = pool.map(_compactChunk, [(name, typecode, n, lo, hi) for lo, hi in bounds])
+    finally:
+        if ownPool:
+            pool.close()
+            pool.join()
+
+    # tail = zeros, fixed size chunks-la (all-zero bytes == 0 for int / float)
+    itemsize = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(name=name)
+    view = _view(shm.buf, typecode, n)
+    try:
+        total = _gather(view, bounds, counts)
+        zeros = bytes(ZERO_CHUNK)
+        for lo in range(total * itemsize, n * itemsize, ZERO_CHUNK):
+            hi = min(n * itemsize, lo + ZERO_CHUNK)
+            shm.buf[lo:hi] = zeros[:hi - lo]
+    finally:
+        del view
+        shm.close()
+    return total
+
+
+def parallelMoveZeros(arr, workers=None, pool=None):
+    # array.array / ndarray (shared illa) → oru segment-ku copy, compact, copy back
+    typecode = arr.typecode if isinstance(arr, array) else arr.dtype.char
+    n = len(arr)
+    if n == 0:
+        return 0
+    nbytes = n * array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        shm.buf[:nbytes] = memoryview(arr).cast("B")
+        kept = compactShared(shm.name, n, typecode, workers, pool)
+        memoryview(arr).cast("B")[:] = shm.buf[:nbytes]
+        return kept
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# _________________________________________________________________________
+# Benchmark (python parallel_compact.py)
+# _________________________________________________________________________
+
+def _bench(n=2 * 10**7, maxWorkers=None):
+    import random
+    import time
+
+    maxWorkers = maxWorkers or os.cpu_count() or 1
+    nbytes = n * array("q").itemsize
+    data = array("q", [random.choice((0, 0, 1, 7)) for _ in range(n)])
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        base = None
+        workers = 1
+        while workers <= maxWorkers:
+            with makePool(workers) as pool:
+                pool.map(_compactChunk, [(shm.name, "q", n, 0, 0)] * workers)  # warm up
+                shm.buf[:nbytes] = memoryview(data).cast("B")
+                start = time.perf_counter()
+                compactShared(shm.name, n, "q", workers, pool)
+                took = time.perf_counter() - start
+            base = base or took
+            print(f"n={n:,} workers={workers:>2}: {took * 1000:9.1f} ms"
+                  f"  vs 1 worker {base / took:5.2f}x")
+            workers *= 2
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# Numbers (int64, 50% zeros, CPython 3.11 + NumPy 2.x, in place, extra
+# memory = oru chunk temp mattum):
+#
+# n=20,000,000 workers= 1:     283.4 ms   (src → dst segments version 433.8 ms)
+# n=20,000,000 workers= 2:     321.3 ms
+# n=20,000,000 workers= 4:     295.1 ms
+#
+# ⚠️ Indha box-la os.cpu_count() == 1 – workers > 1 rows pool / process
+# overhead mattum kaattudhu, scaling curve illa. Multi-core machine-la
+# python parallel_compact.py run panni 1 → cpu_count curve paarunga; step 1
+# memory-bandwidth bound, step 3 (gather memmove) serial.
+
+
+if __name__ == "__main__":
+    arr = array("q", [0, 1, 0, 3, 12])
+    print(parallelMoveZeros(arr, workers=2), arr.tolist())
+    _bench()
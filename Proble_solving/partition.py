@@ -0,0 +1,159 @@
+# _________________________________________________________________________
+# 🟢 Stable Partition Engine – moveZeros for any predicate
+# _________________________________________________________________________
+
+# Problem:
+# day2.py moveZeros literal 0 mattum check pannum, adhuvum swap line
+# comment-la irukku – edhuvum move aagala. Namakku None, NaN, sentinel
+# values ellam remove panna venum.
+
+# Pattern:
+# Two pointer (write index j) + chunk processing.
+
+# Key logic:
+# keep(x) True na front-la same order-la irukkum (stable), illana end-ku pogum.
+# * DropValue(v) (builtin predicates KEEP_NONZERO / KEEP_NOT_NONE /
+#   KEEP_NOT_NAN) → fast path: BLOCK size chunk edutthu comprehension /
+#   filter(None) (per-item function call illa), kept items arr[j:]-la
+#   ezhudhi, tail-a dropped value-aala fill pannum.
+# * fill=value kuduthaa → any callable-kum same chunked compaction.
+# * plain callable, fill illa → classic two-pointer swap (dropped items
+#   apdiye end-la irukkum, order maybe maarum).
+# Return = kept count.
+
+# Streaming: CompactStream(iterable, keep) – chunkSize varaikkum mattum
+# buffer, kept items yield pannum; .kept / .dropped counts.
+
+# _________________________________________________________________________
+
+from array import array
+from itertools import islice, repeat
+
+from rotation import BLOCK
+
+
+class DropValue:
+    # builtin predicate: keep x unless x == value (NaN → x != x)
+
+    def __init__(self, value):
+        self.value = value
+        self.isNan = value != value
+
+    def __call__(self, x):
+        if self.isNan:
+            return x == x
+        if self.value is None:
+            return x is not None
+        return x != self.value
+
+    def __repr__(self):
+        return f"DropValue({self.value!r})"
+
+
+KEEP_NONZERO = DropValue(0)
+KEEP_NOT_NONE = DropValue(None)
+KEEP_NOT_NAN = DropValue(float("nan"))
+
+_MISSING = object()
+
+
+def _like(chunk, items):
+    # chunk same container type-la items build pannu (slice assign-ku)
+    if isinstance(chunk, array):
+        return array(chunk.typecode, items)
+    if isinstance(chunk, (bytearray, bytes)):
+        return bytearray(items)
+    return list(items)
+
+
+def _keepChunk(chunk, keep):
+    # kept items of one chunk as list; builtin predicates-ku per-item
+    # function call illa (comprehension / C-level filter)
+    if isinstance(keep, DropValue):
+        if keep.isNan:
+            return [x for x in chunk if x == x]
+        value = keep.value
+        if value is None:
+            return [x for x in chunk if x is not None]
+        if value == 0 and isinstance(chunk, (array, bytearray, bytes)) \
+                and getattr(chunk, "typecode", "") != "u":
+            return list(filter(None, chunk))   # numeric: falsy == zero
+        return [x for x in chunk if x != value]
+    return list(filter(keep, chunk))
+
+
+def _compact(arr, keep, fill):
+    n = len(arr)
+    j = 0
+    for i in range(0, n, BLOCK):
+        chunk = arr[i:i + BLOCK]
+        kept = _keepChunk(chunk, keep)
+        if fill is _MISSING and len(kept) < len(chunk):
+            fill = next(x for x in chunk if not keep(x))
+        arr[j:j + len(kept)] = _like(chunk, kept)
+        j += len(kept)
+
+    # tail fill, chunk by chunk (extra memory BLOCK mattum)
+    for i in range(j, n, BLOCK):
+        size = min(BLOCK, n - i)
+        arr[i:i + size] = _like(arr[i:i], repeat(fill, size))
+    return j
+
+
+def _swapPartition(arr, keep):
+    j = 0  # next kept element place
+    for i in range(len(arr)):
+        if keep(arr[i]):
+            if i != j:
+                arr[j], arr[i] = arr[i], arr[j]
+            j += 1
+    return j
+
+
+def stablePartition(arr, keep=KEEP_NONZERO, fill=_MISSING):
+    # keep items front-la (stable), return kept count
+    if isinstance(keep, DropValue) or fill is not _MISSING:
+        return _compact(arr, keep, fill)
+    return _swapPartition(arr, keep)
+
+
+class CompactStream:
+    # iterator-a compact pannum, max chunkSize items mattum memory-la
+
+    def __init__(self, iterable, keep=KEEP_NONZERO, chunkSize=BLOCK):
+        if chunkSize <= 0:
+            raise ValueError("chunkSize must be positive")
+        self._it = iter(iterable)
+        self._keep = keep
+        self._chunkSize = chunkSize
+        self.kept = 0
+        self.dropped = 0
+
+    def chunks(self):
+        while True:
+            chunk = list(islice(self._it, self._chunkSize))
+            if not chunk:
+                return
+            kept = _keepChunk(chunk, self._keep)
+            self.kept += len(kept)
+            self.dropped += len(chunk) - len(kept)
+            if kept:
+                yield kept
+
+    def __iter__(self):
+        for kept in self.chunks():
+            yield from kept
+
+
+if __name__ == "__main__":
+    arr = [0, 1, 0, 3, 12]
+    print(stablePartition(arr), arr)
+
+    arr = [1.5, float("nan"), 2.5, float("nan")]
+    print(stablePartition(arr, KEEP_NOT_NAN), arr)
+
+    arr = ["a", None, "b", "c", None]
+    print(stablePartition(arr, lambda x: x is not None, fill=""), arr)
+
+    stream = CompactStream(iter([0, 4, 0, 0, 5, 6]), chunkSize=2)
+    print(list(stream), stream.kept, stream.dropped)
@@ -0,0 +1,274 @@
+# _________________________________________________________________________
+# 🟢 ArrayPipeline – rotate / reverse / compact / map steps fuse panni one pass
+# _________________________________________________________________________
+
+# Problem:
+# Jobs: rotateArray(arr, k) → day1 reverse → moveZeros. Ovvoru step-um
+# full list-a walk panni rewrite pannum → 3 steps = 3 passes.
+
+# Pattern:
+# Index manipulation algebra (lazy evaluation).
+
+# Key logic:
+# * rotate / reverse = index permutation. out[i] = in[src(i)],
+#   src(i) = (s·i + b) mod n, s = ±1:
+#     rotate k  → s = 1,  b = -k
+#     reverse   → s = -1, b = n - 1
+#   Rendu steps compose: f then g → src = f(g(i)) = (sf·sg, sf·bg + bf).
+#   Evlo rotate / reverse irundhaalum oru (s, b) dhaan.
+# * rotate / reverse mattum → (s, b) gather = rendu C-level slices:
+#   s = 1 → in[b:] + in[:b], s = -1 → in[b::-1] + in[:b:-1].
+# * map / compact irundha: perm order-la islice iterators (copy illa),
+#   mela map(fn) lazy-aa, compact adhe iteration-la kept list build pannum
+#   → ovvoru element-um ellaa steps-aiyum oru thadava dhaan kadakkum.
+#   DropValue-ku dropped items count mattum (tail = drop value).
+# * Compact apram varra rotate / reverse (post) – kept + tail-a build
+#   pannumbodhe rotated order-la pieces (slices) serkkurom, thani gather illa.
+#   Compact / map compact-ku apram vandha mattum pudhu pass (segment).
+# * ndarray: maps full array-la (vectorized / ufunc, permutation-oda
+#   commute), mask, apram pre perm + compact order + post perm ellaam
+#   oru index array-aa compose → data-va oru np.take mattum.
+# passes = segments – list path-la ovvonnum data mela oru Python pass;
+# ndarray-la oru take (maps / mask thani vectorized ops, count illa).
+# passesSaved = steps count - segments count.
+
+# _________________________________________________________________________
+
+from array import array
+from itertools import chain, islice, repeat
+
+from partition import DropValue, KEEP_NONZERO
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana list path mattum
+    np = None
+
+
+IDENTITY = (1, 0)
+
+
+def _compose(f, g, n):
+    # f then g (g output index → f index) → src(i) = f(g(i))
+    sf, bf = f
+    sg, bg = g
+    return sf * sg, (sf * bg + bf) % n
+
+
+def _gather(seq, perm):
+    s, b = perm
+    if s == 1:
+        return seq[b:] + seq[:b]
+    return seq[b::-1] + seq[:b:-1]
+
+
+def _ordered(seq, perm):
+    # perm order-la items, copy illaama (C-level iterators, skip mattum)
+    s, b = perm
+    if s == 1:
+        return chain(islice(seq, b, None), islice(seq, b))
+    back = len(seq) - 1 - b
+    return chain(islice(reversed(seq), back, None), islice(reversed(seq), back))
+
+
+def _keepValues(values, keep):
+    # DropValue fast path – per-item function call illa
+    if keep.isNan:
+        return [x for x in values if x == x]
+    value = keep.value
+    if value is None:
+        return [x for x in values if x is not None]
+    return [x for x in values if x != value]
+
+
+def _assemble(kept, tail, keep, perm, n):
+    # compacted = kept + tail; post (s, b) gather-um serthu oru output build.
+    # tail = dropped items list, illana count (DropValue – ellaam keep.value)
+    s, b = perm
+    if s == -1:
+        # reversed(kept + tail) = reversed(tail) + reversed(kept), apram left rotate
+        kept.reverse()
+        if isinstance(tail, list):
+            tail.reverse()
+        pieces, b = [tail, kept], (n - 1 - b) % n
+    else:
+        pieces = [kept, tail]
+    first, second = pieces
+    size = first if isinstance(first, int) else len(first)
+    if b <= size:
+        parts = (_cut(first, b, None), second, _cut(first, 0, b))
+    else:
+        parts = (_cut(second, b - size, None), first, _cut(second, 0, b - size))
+    out = []
+    for part in parts:
+        out.extend(repeat(keep.value, part) if isinstance(part, int) else part)
+    return out
+
+
+def _cut(piece, lo, hi):
+    # piece[lo:hi]; count piece-ku length mattum
+    if isinstance(piece, int):
+        return (piece if hi is None else hi) - lo
+    return piece[lo:hi]
+
+
+def _like(data, items):
+    # list result → data-oda container type
+    if isinstance(data, array):
+        return array(data.typecode, items)
+    if isinstance(data, (bytearray, bytes)):
+        return type(data)(items)
+    return items
+
+
+class _Segment:
+    # pre (s, b) + maps + optional compact + post (s, b) → one pass
+
+    def __init__(self):
+        self.pre = []       # ("rotate", k) / ("reverse",) in order
+        self.maps = []
+        self.keep = None
+        self.post = []
+
+    def perms(self, steps, n):
+        perm = IDENTITY
+        for step in steps:
+            g = (1, -step[1] % n) if step[0] == "rotate" else (-1, n - 1)
+            perm = _compose(perm, g, n)
+        return perm
+
+
+class ArrayPipeline:
+
+    def __init__(self):
+        self._steps = []
+
+    def rotate(self, k):
+        self._steps.append(("rotate", k))
+        return self
+
+    def reverse(self):
+        self._steps.append(("reverse",))
+        return self
+
+    def compact(self, keep=KEEP_NONZERO):
+        self._steps.append(("compact", keep))
+        return self
+
+    def map(self, fn):
+        self._steps.append(("map", fn))
+        return self
+
+    def _segments(self):
+        segments = []
+        seg = _Segment()
+        for step in self._steps:
+            kind = step[0]
+            if kind in ("rotate", "reverse"):
+                (seg.pre if seg.keep is None else seg.post).append(step)
+                continue
+            if seg.keep is not None:        # compact apram map / compact → new pass
+                segments.append(seg)
+                seg = _Segment()
+            if kind == "map":
+                seg.maps.append(step[1])
+            else:
+                seg.keep = step[1]
+        if self._steps:
+            segments.append(seg)
+        return segments
+
+    @property
+    def passes(self):
+        return len(self._segments())
+
+    @property
+    def passesSaved(self):
+        return len(self._steps) - self.passes
+
+    # ______________________________ execution ______________________________
+
+    def _runList(self, seq, seg):
+        n = len(seq)
+        pre = seg.perms(seg.pre, n)
+        if not seg.maps and seg.keep is None:
+            return _gather(seq, pre)                # C-level slices mattum
+        values = _ordered(seq, pre)
+        for fn in seg.maps:
+            values = map(fn, values)                # lazy – adhe pass-la
+        if seg.keep is None:
+            return list(values)
+        keep = seg.keep
+        if isinstance(keep, DropValue):
+            kept = _keepValues(values, keep)
+            tail = n - len(kept)                    # ellaam drop value dhaan
+        else:
+            kept, tail = [], []
+            for x in values:
+                (kept if keep(x) else tail).append(x)
+        return _assemble(kept, tail, keep, seg.perms(seg.post, n), n)
+
+    def _runNumpy(self, arr, seg):
+        n = len(arr)
+        s, b = seg.perms(seg.pre, n)
+        index = None if (s, b) == IDENTITY else (s * np.arange(n) + b) % n
+        for fn in seg.maps:
+            arr = fn(arr)           # elementwise – permutation-kku munnaadi podhum
+        if seg.keep is not None:
+            keep = seg.keep
+            if isinstance(keep, DropValue):
+                mask = ~np.isnan(arr) if keep.isNan else arr != keep.value
+            else:
+                mask = np.asarray(keep(arr), dtype=bool)
+            if index is not None:
+                mask = mask[index]
+            order = np.concatenate((np.flatnonzero(mask), np.flatnonzero(~mask)))
+            index = order if index is None else index[order]
+            s, b = seg.perms(seg.post, n)
+            if (s, b) != IDENTITY:
+                index = index[(s * np.arange(n) + b) % n]
+        # pre + compact + post ellaam oru index → data oru take mattum
+        return arr if index is None else np.take(arr, index)
+
+    def run(self, data, inplace=False):
+        # ellaa steps-um execute; result same container type (inplace → data)
+        if np is not None and isinstance(data, np.ndarray):
+            result = data
+            if len(data):
+                for seg in self._segments():
+                    result = self._runNumpy(result, seg)
+            if inplace:
+                data[...] = result
+                return data
+            return result if result is not data else data.copy()
+
+        result = data if isinstance(data, list) else list(data)
+        if len(result):
+            for seg in self._segments():
+                result = self._runList(result, seg)
+        if inplace:
+            data[:] = _like(data, result)
+            return data
+        return _like(data, result) if result is not data else list(data)
+
+    def __repr__(self):
+        names = " → ".join(
+            f"{s[0]}({s[1]})" if s[0] == "rotate" else s[0] for s in self._steps
+        )
+        return f"ArrayPipeline({names or 'empty'}; {self.passes} passes, saved {self.passesSaved})"
+
+
+if __name__ == "__main__":
+    p = ArrayPipeline().rotate(2).reverse().compact()
+    print(p)
+    print(p.run([0, 1, 0, 3, 12]))      # rotate → [3, 12, 0, 1, 0], reverse, compact
+
+    p = ArrayPipeline().map(lambda x: x * 10).rotate(1).rotate(-3).reverse().compact().rotate(1)
+    print(p, p.run([1, 0, 2, 0, 3]))
+
+    data = array("q", [5, 0, 7, 0, 9])
+    ArrayPipeline().compact().reverse().run(data, inplace=True)
+    print(data.tolist())                # [0, 0, 9, 7, 5]
+
+    if np is not None:
+        print(p.run(np.array([1, 0, 2, 0, 3])))
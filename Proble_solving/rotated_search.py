@@ -0,0 +1,172 @@
+# _________________________________________________________________________
+# 🟢 Rotated Sorted Search – rotateArray panna sorted array-la O(log n) lookup
+# _________________________________________________________________________
+
+# Problem:
+# Sorted array-a rotateArray(arr, k) pannitu value linear scan-la
+# thedurom → O(n). Sorted dhaan, aana oru edathula "break" irukku.
+
+# Pattern:
+# Modified binary search (pivot find) + two sorted halves.
+
+# Key logic:
+# sorted [1, 2, 3, 4, 5, 6, 7] → rotate 3 → [5, 6, 7, 1, 2, 3, 4]
+#                                                     ↑ pivot = 3 (minimum)
+# * Pivot: mid vs hi compare
+#     arr[mid] > arr[hi] → pivot mid-ku right-la (lo = mid + 1)
+#     arr[mid] < arr[hi] → pivot mid or left-la  (hi = mid)
+#     equal (duplicates) → arr[hi - 1] > arr[hi] na hi dhaan pivot,
+#                          illana hi -= 1 (worst case O(n), all-equal-ish)
+# * Pivot apram arr[pivot:] and arr[:pivot] rendum sorted runs.
+#   lowerBound(x) (x-a vida chinna count) = bisect rendu runs-layum
+#   (bisect lo / hi args → slice copy illa) → O(log n).
+#   rank r-oda physical index = (pivot + r) % n.
+# * Pivot index object-la cache. index.rotate(k) → array-um rotate,
+#   pivot = (pivot + k) % n (thirumba search illa). Veliya array maathina
+#   refresh() call pannanum. index.version ovvoru maatrathukkum +1.
+# * Batch: numpy irundha rendu runs mela searchsorted (views, copy illa),
+#   illana bisect loop.
+
+# _________________________________________________________________________
+
+from bisect import bisect_left
+
+from rotation import rotateInPlace
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana bisect loop
+    np = None
+
+
+def findPivot(arr):
+    # smallest element-oda index = rotation start (sorted → 0)
+    n = len(arr)
+    if n == 0:
+        return 0
+    lo, hi = 0, n - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] > arr[hi]:
+            lo = mid + 1
+        elif arr[mid] < arr[hi]:
+            hi = mid
+        elif arr[hi - 1] > arr[hi]:
+            return hi
+        else:
+            hi -= 1
+    return lo
+
+
+class RotatedSortedIndex:
+
+    def __init__(self, arr):
+        self._arr = arr
+        self.refresh()
+
+    def refresh(self):
+        # array veliya maathina apram call pannunga (pivot + numpy cache reset)
+        self._pivot = findPivot(self._arr)
+        self._view = None
+        self.version = getattr(self, "version", -1) + 1
+
+    @property
+    def pivot(self):
+        return self._pivot
+
+    @property
+    def array(self):
+        return self._arr
+
+    def __len__(self):
+        return len(self._arr)
+
+    def rotate(self, k):
+        # array-a right rotate by k; pivot arithmetic-aa update
+        n = len(self._arr)
+        self._view = None       # array.array export release (illana resize BufferError)
+        rotateInPlace(self._arr, k)
+        if n:
+            self._pivot = (self._pivot + k) % n
+        self.version += 1
+        return self
+
+    # ____________________________ single queries ___________________________
+
+    def lowerBound(self, x):
+        # x-a vida chinna elements count (sorted order-la x poga vendiya rank)
+        arr, p, n = self._arr, self._pivot, len(self._arr)
+        return bisect_left(arr, x, p, n) - p + bisect_left(arr, x, 0, p)
+
+    def physicalIndex(self, rank):
+        return (self._pivot + rank) % len(self._arr)
+
+    def find(self, x):
+        # x-oda physical index (first occurrence in sorted order), illana -1
+        n = len(self._arr)
+        r = self.lowerBound(x)
+        if r < n:
+            i = self.physicalIndex(r)
+            if self._arr[i] == x:
+                return i
+        return -1
+
+    def __contains__(self, x):
+        return self.find(x) != -1
+
+    def countRange(self, lo, hi):
+        # lo <= value < hi count
+        if hi <= lo:
+            return 0
+        return self.lowerBound(hi) - self.lowerBound(lo)
+
+    # ____________________________ batch queries ____________________________
+
+    def _runs(self):
+        if self._view is None:
+            view = np.asarray(self._arr)    # list → oru copy per version
+            self._view = (view, view[self._pivot:], view[:self._pivot])
+        return self._view
+
+    def lowerBounds(self, keys):
+        if np is not None:
+            _, small, large = self._runs()
+            keys = np.asarray(keys)
+            return np.searchsorted(small, keys) + np.searchsorted(large, keys)
+        return [self.lowerBound(x) for x in keys]
+
+    def findMany(self, keys):
+        # find() ovvoru key-kum; numpy na ndarray of indices (-1 = illa)
+        if np is None:
+            return [self.find(x) for x in keys]
+        n = len(self._arr)
+        keys = np.asarray(keys)
+        ranks = self.lowerBounds(keys)
+        if n == 0:
+            return np.full(len(keys), -1, dtype=np.intp)
+        idx = (self._pivot + np.minimum(ranks, n - 1)) % n
+        values = self._runs()[0][idx]
+        return np.where((ranks < n) & (values == keys), idx, -1)
+
+    def containsMany(self, keys):
+        found = self.findMany(keys)
+        if np is not None:
+            return found != -1
+        return [i != -1 for i in found]
+
+    def countRanges(self, los, his):
+        if np is not None:
+            return np.maximum(self.lowerBounds(his) - self.lowerBounds(los), 0)
+        return [self.countRange(lo, hi) for lo, hi in zip(los, his)]
+
+
+if __name__ == "__main__":
+    arr = [1, 2, 3, 4, 5, 6, 7]
+    rotateInPlace(arr, 3)
+    idx = RotatedSortedIndex(arr)
+    print(arr, idx.pivot)                                   # [5, 6, 7, 1, 2, 3, 4] 3
+    print(idx.find(6), 8 in idx, idx.countRange(3, 6))      # 1 False 3
+
+    idx.rotate(2)
+    print(arr, idx.pivot, idx.find(6))
+    print(idx.findMany([1, 4, 9]), idx.countRanges([0, 2], [3, 8]))
@@ -0,0 +1,165 @@
+# _________________________________________________________________________
+# 🟢 RotatedView – O(1) lazy rotation (copy illa, move illa)
+# _________________________________________________________________________
+
+# Problem:
+# rotateArray(arr, k) ellaa n elements-aiyum move pannum. Aana consumer
+# rotate panni 2-3 elements mattum read pannuvaanga → waste.
+
+# Pattern:
+# Modulo trick (index manipulation without moving data).
+
+# Key logic:
+# View base sequence + start offset mattum store pannum.
+# view[i] = base[(start + i) % n]
+# Right rotate by k → start = (start - k) % n. So rotate pannradhu O(1),
+# repeated rotations offsets add aagudhu (view-ku mela view build aagadhu).
+# Slice / iteration base-oda max 2 contiguous pieces-la nadakkum
+# (list / str / array → `+`, ndarray → np.concatenate).
+# materialize() → contiguous copy venum na mattum (start == 0 na copy illa).
+
+# Mistake I made:
+# Base list length change aana view offset thappu aagidum – view edutha
+# apram base-a resize pannakoodaadhu.
+
+# _________________________________________________________________________
+
+from collections.abc import Sequence
+
+from rotation import BLOCK, rotateInPlace
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana ndarray base varaadhu
+    np = None
+
+
+def _join(left, right):
+    # ndarray-la `+` element-wise add pannum, concat illa
+    if np is not None and isinstance(left, np.ndarray):
+        return np.concatenate((left, right))
+    return left + right
+
+
+class RotatedView(Sequence):
+
+    def __init__(self, base, k=0):
+        if isinstance(base, RotatedView):
+            start = base._start
+            base = base._base
+        else:
+            start = 0
+        self._base = base
+        n = len(base)
+        self._start = (start - k) % n if n else 0
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def offset(self):
+        # right rotation amount, same meaning as k in rotateArray(arr, k)
+        n = len(self._base)
+        return (n - self._start) % n if n else 0
+
+    def rotate(self, k):
+        return RotatedView(self, k)
+
+    def __len__(self):
+        return len(self._base)
+
+    def _piece(self, j, count, step):
+        # `count` items from base starting at j, moving by step
+        if count <= 0:
+            return self._base[0:0]
+        stop = j + step * count
+        if stop < 0:
+            stop = None
+        return self._base[j:stop:step]
+
+    def __getitem__(self, index):
+        n = len(self._base)
+        if isinstance(index, slice):
+            rng = range(*index.indices(n))
+            if not rng:
+                return self._base[0:0]
+            start = self._start
+            step = rng.step
+            # rotated positions wrap at most once → max rendu pieces
+            if step > 0:
+                first = len(range(rng.start, min(rng.stop, n - start), step))
+            else:
+                first = len(range(rng.start, max(rng.stop, n - start - 1), step))
+            j = start + rng.start
+            if j >= n:
+                j -= n
+            if first == len(rng):
+                return self._piece(j, first, step)
+            if first == 0:
+                return self._piece(j, len(rng), step)
+            k = start + rng[first]
+            if k >= n:
+                k -= n
+            return _join(self._piece(j, first, step), self._piece(k, len(rng) - first, step))
+
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("RotatedView index out of range")
+        j = self._start + index
+        if j >= n:
+            j -= n
+        return self._base[j]
+
+    def __iter__(self):
+        base = self._base
+        n = len(base)
+        start = self._start
+        for lo, hi in ((start, n), (0, start)):
+            for i in range(lo, hi, BLOCK):
+                yield from base[i:min(i + BLOCK, hi)]
+
+    def __reversed__(self):
+        base = self._base
+        start = self._start
+        for lo, hi in ((0, start), (start, len(base))):
+            for i in range(hi, lo, -BLOCK):
+                chunk = base[max(i - BLOCK, lo):i]
+                yield from reversed(chunk)
+
+    def __contains__(self, value):
+        return value in self._base  # rotation membership-a maathaadhu
+
+    def count(self, value):
+        if np is not None and isinstance(self._base, np.ndarray):
+            return int(np.count_nonzero(self._base == value))
+        return self._base.count(value)
+
+    def materialize(self, inplace=False):
+        # inplace=True → base-aiye rotate pannum (mutable base venum), view reset
+        if self._start == 0:
+            return self._base
+        if inplace:
+            rotateInPlace(self._base, self.offset)
+            self._start = 0
+            return self._base
+        return _join(self._base[self._start:], self._base[:self._start])
+
+    def __repr__(self):
+        return f"RotatedView({self._base!r}, k={self.offset})"
+
+
+if __name__ == "__main__":
+    arr = [1, 2, 3, 4, 5]
+    view = RotatedView(arr, 2)
+    print(view[0], view[-1], view[1:4], list(view))
+    print(view.rotate(1).rotate(1).materialize())
+
+    if np is not None:
+        # ndarray base: pieces concat aaganum, add illa
+        nd = RotatedView(np.arange(6), 3)
+        assert nd[1:5].tolist() == [4, 5, 0, 1]
+        assert nd[::-2].tolist() == [2, 0, 4]
+        assert nd.materialize().tolist() == [3, 4, 5, 0, 1, 2]
+        print(nd[1:5], nd.materialize())
@@ -0,0 +1,242 @@
+# _________________________________________________________________________
+# 🟢 Rotation Engine – Rotate Array by K (Right Rotate, in-place)
+# _________________________________________________________________________
+
+# Problem:
+# day2.py-la slicing rotateArray last_part + first_part + join create pannudhu.
+# Oru call-ku ~3x array memory edukkum → multi-GB list-la OOM kill aagudhu.
+
+# Pattern:
+# In-place index manipulation. Extra memory = constant (BLOCK items max).
+
+# Key logic:
+# * reversal  → reverse whole, reverse first k, reverse remaining
+# * juggling  → gcd(n, k) cycles, ovvoru element-um oru thadava dhaan move aagum
+# * blockswap → Gries-Mills: chinna block-a swap panni problem-a shrink pannradhu
+# * shift     → k (or n-k) romba chinna-na, andha part mattum copy panni
+#               del + insert (C memmove) pannradhu
+# * auto      → n, k paathu best method choose pannum (chooseMethod)
+
+# Works on list, array.array and bytearray (slice assign + reverse() irukku).
+# Reversal / swap ellam BLOCK size chunks-la nadakkum, so pure-Python loop
+# per element illa, and extra memory never crosses 2 * BLOCK items.
+
+# Mistake I made:
+# arr[:k] = reversed(arr[:k]) → arr[:k] copy create aagudhu, in-place illa.
+
+# _________________________________________________________________________
+
+from math import gcd
+
+
+BLOCK = 4096        # max items copied at a time (bounded extra memory)
+SHIFT_LIMIT = BLOCK  # min(k, n - k) <= this → "shift" method
+
+
+def _reverseRange(arr, lo, hi, block=BLOCK):
+    # reverse arr[lo:hi] in-place, two blocks from both ends at a time
+    if lo == 0 and hi == len(arr):
+        arr.reverse()
+        return
+    while hi - lo >= 2 * block:
+        left = arr[lo:lo + block]
+        right = arr[hi - block:hi]
+        left.reverse()
+        right.reverse()
+        arr[lo:lo + block] = right
+        arr[hi - block:hi] = left
+        lo += block
+        hi -= block
+    if hi - lo > 1:
+        middle = arr[lo:hi]
+        middle.reverse()
+        arr[lo:hi] = middle
+
+
+def _swapRanges(arr, i, j, m, block=BLOCK):
+    # swap arr[i:i+m] <-> arr[j:j+m] (ranges must not overlap)
+    for off in range(0, m, block):
+        size = min(block, m - off)
+        a = i + off
+        b = j + off
+        tmp = arr[a:a + size]
+        arr[a:a + size] = arr[b:b + size]
+        arr[b:b + size] = tmp
+
+
+def rotateSlice(arr, k):
+    # old day2.py version – kept only as baseline for benchmarks (~3x memory)
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    arr[:] = arr[n - k:] + arr[:n - k]
+    return arr
+
+
+def rotateReversal(arr, k):
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    if k == 0:
+        return arr
+    _reverseRange(arr, 0, n)
+    _reverseRange(arr, 0, k)
+    _reverseRange(arr, k, n)
+    return arr
+
+
+def rotateJuggling(arr, k):
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    if k == 0:
+        return arr
+
+    # right rotate by k == left rotate by d
+    d = n - k
+    for start in range(gcd(n, d)):
+        tmp = arr[start]
+        j = start
+        while True:
+            nxt = j + d
+            if nxt >= n:
+                nxt -= n
+            if nxt == start:
+                break
+            arr[j] = arr[nxt]
+            j = nxt
+        arr[j] = tmp
+    return arr
+
+
+def rotateBlockSwap(arr, k):
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    if k == 0:
+        return arr
+
+    # Gries-Mills: arr = A B, left rotate by d = len(A)
+    d = n - k
+    i = d       # size of A still to place
+    j = n - d   # size of B still to place
+    while i != j:
+        if i < j:
+            _swapRanges(arr, d - i, d + j - i, i)
+            j -= i
+        else:
+            _swapRanges(arr, d - i, d, j)
+            i -= j
+    _swapRanges(arr, d - i, d, i)
+    return arr
+
+
+def rotateShift(arr, k):
+    n = len(arr)
+    if n == 0:
+        return arr
+    k = k % n
+    if k == 0:
+        return arr
+
+    # copy only the smaller side, C-level memmove does the rest
+    if k <= n - k:
+        tail = arr[n - k:]
+        del arr[n - k:]
+        arr[:0] = tail
+    else:
+        head = arr[:n - k]
+        del arr[:n - k]
+        arr[len(arr):] = head
+    return arr
+
+
+METHODS = {
+    "reversal": rotateReversal,
+    "juggling": rotateJuggling,
+    "blockswap": rotateBlockSwap,
+    "shift": rotateShift,
+    "slice": rotateSlice,
+}
+
+
+def chooseMethod(n, k):
+    if n == 0:
+        return "reversal"
+    k = k % n
+    if min(k, n - k) <= SHIFT_LIMIT:
+        return "shift"
+    return "reversal"
+
+
+def rotateInPlace(arr, k, method="auto"):
+    if method == "auto":
+        method = chooseMethod(len(arr), k)
+    try:
+        rotate = METHODS[method]
+    except KeyError:
+        raise ValueError(
+            f"unknown rotate method {method!r}, use one of {sorted(METHODS)} or 'auto'"
+        ) from None
+    return rotate(arr, k)
+
+
+# _________________________________________________________________________
+# Benchmark (python rotation.py)
+# _________________________________________________________________________
+
+def _bench(sizes=(10**5, 10**6), repeats=3):
+    import time
+    import tracemalloc
+
+    for n in sizes:
+        for k in (3, n // 3):
+            for name in ("slice", "reversal", "blockswap", "shift", "juggling", "auto"):
+                best = None
+                for _ in range(repeats):
+                    arr = list(range(n))
+                    start = time.perf_counter()
+                    rotateInPlace(arr, k, name)
+                    took = time.perf_counter() - start
+                    best = took if best is None else min(best, took)
+
+                arr = list(range(n))
+                tracemalloc.start()
+                rotateInPlace(arr, k, name)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                print(f"n={n:>9,} k={k:>7,} {name:>9}: "
+                      f"{best * 1000:9.2f} ms  peak extra {peak / 1024:10.1f} KiB")
+
+
+# Numbers (list of ints, CPython 3.11, best of 3, peak = tracemalloc):
+#
+# n=1,000,000 k=      3     slice:  26.67 ms  peak extra 15625.0 KiB
+# n=1,000,000 k=      3  reversal:   8.89 ms  peak extra    96.1 KiB
+# n=1,000,000 k=      3 blockswap: 351.70 ms  peak extra     0.3 KiB
+# n=1,000,000 k=      3     shift:   0.78 ms  peak extra     0.1 KiB
+# n=1,000,000 k=      3  juggling:  98.46 ms  peak extra     0.2 KiB
+# n=1,000,000 k=333,333     slice:  30.32 ms  peak extra 15625.1 KiB
+# n=1,000,000 k=333,333  reversal:  11.45 ms  peak extra   152.4 KiB
+# n=1,000,000 k=333,333 blockswap: 368.51 ms  peak extra    96.4 KiB
+# n=1,000,000 k=333,333     shift:   4.98 ms  peak extra  5208.4 KiB
+# n=1,000,000 k=333,333  juggling:  51.81 ms  peak extra     0.2 KiB
+#
+# 👉 slice = 2x list size extra (plus the list itself) – idhu dhaan OOM reason
+# 👉 reversal = ~3x faster than slice, extra memory fixed (BLOCK chunks)
+# 👉 shift = fastest when k chinnadhu; big k-la memory k size aagum, so
+#    auto adha SHIFT_LIMIT varaikkum mattum use pannum
+# 👉 juggling = per-element Python loop; blockswap = k chinnadha irundha
+#    n / k small swaps. Rendum slow, strict O(1) memory venum na mattum use pannunga
+
+
+if __name__ == "__main__":
+    arr = [1, 2, 3, 4, 5]
+    for name in METHODS:
+        print(name, rotateInPlace(list(arr), 2, name))
+    _bench()
@@ -0,0 +1,202 @@
+# _________________________________________________________________________
+# 🟢 Sliding Window – rolling max / min / sum / mean (fixed windows)
+# _________________________________________________________________________
+
+# Problem:
+# Dashboard rolling max over w points ovvoru position-kum w items scan
+# pannudhu → O(n·w). Millions of points, w = 1000 na romba slow.
+
+# Pattern:
+# Sliding window + monotonic deque + running total.
+
+# Key logic:
+# * max: deque-la (index, value) decreasing order-la vechukkurom.
+#   Pudhu x vandha, x-a vida chinna / equal values back-la irundhu pop
+#   (avanga inimel max aagave mudiyaadhu). Front index window-a vittu
+#   pona popleft. Front = window max. Ovvoru item max oru push, oru pop
+#   → O(1) amortized. min = same, comparison reverse.
+# * sum: sum += x (new) - x[i - w] (leaving). mean = sum / w.
+# * Multiple window sizes → one pass: ring buffer last max(w) items
+#   (leaving item edukka), ovvoru size-kum own deques + running sum.
+
+# NumPy path (ndarray):
+# * max / min: w-size blocks-aa reshape (view), block prefix max + block
+#   suffix max (van Herk / Gil-Werman) → result[i] = max(suffix[i],
+#   prefix[i + w - 1]) → O(n) irrespective of w. Chinna w-ku
+#   sliding_window_view (stride trick, copy illa) mela .max(axis=1) faster.
+# * sum: cumsum → c[i + w] - c[i]. Floats-la periya n-ku rounding drift
+#   varum (ints exact).
+
+# _________________________________________________________________________
+
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # numpy illana iterator path mattum
+    np = None
+
+
+STATS = ("max", "min", "sum", "mean")
+SMALL_WINDOW = 16   # idhukku keezha numpy path sliding_window_view use pannum
+
+
+def _checkArgs(sizes, stats):
+    sizes = sorted(set(sizes))
+    if not sizes or sizes[0] <= 0:
+        raise ValueError("window sizes must be positive")
+    unknown = set(stats) - set(STATS)
+    if unknown:
+        raise ValueError(f"unknown stats {sorted(unknown)}; choose from {STATS}")
+    return sizes, tuple(stats)
+
+
+def slidingWindows(iterable, sizes, stats=STATS):
+    # one pass; yield (i, {(stat, w): value}) – i = window last item index,
+    # full-aa irukkura windows mattum dict-la
+    sizes, stats = _checkArgs(sizes, stats)
+    wantMax = "max" in stats
+    wantMin = "min" in stats
+    wantSum = "sum" in stats or "mean" in stats
+    wantMean = "mean" in stats
+
+    maxW = sizes[-1]
+    ring = [None] * maxW                    # last maxW items
+    maxQ = {w: deque() for w in sizes}
+    minQ = {w: deque() for w in sizes}
+    sums = dict.fromkeys(sizes, 0)
+
+    for i, x in enumerate(iterable):
+        slot = i % maxW
+        out = {}
+        for w in sizes:
+            full = i >= w - 1
+            if wantMax:
+                q = maxQ[w]
+                while q and q[-1][1] <= x:
+                    q.pop()
+                q.append((i, x))
+                if q[0][0] <= i - w:
+                    q.popleft()
+                if full:
+                    out["max", w] = q[0][1]
+            if wantMin:
+                q = minQ[w]
+                while q and q[-1][1] >= x:
+                    q.pop()
+                q.append((i, x))
+                if q[0][0] <= i - w:
+                    q.popleft()
+                if full:
+                    out["min", w] = q[0][1]
+            if wantSum:
+                s = sums[w] + x
+                if i >= w:
+                    s -= ring[(i - w) % maxW]   # leaving item (slot overwrite munnaadi)
+                sums[w] = s
+                if full:
+                    if "sum" in stats:
+                        out["sum", w] = s
+                    if wantMean:
+                        out["mean", w] = s / w
+        ring[slot] = x
+        if out:
+            yield i, out
+
+
+def _rolling(iterable, w, stat):
+    for _, out in slidingWindows(iterable, (w,), (stat,)):
+        yield out[stat, w]
+
+
+def rollingMax(iterable, w):
+    return _rolling(iterable, w, "max")
+
+
+def rollingMin(iterable, w):
+    return _rolling(iterable, w, "min")
+
+
+def rollingSum(iterable, w):
+    return _rolling(iterable, w, "sum")
+
+
+def rollingMean(iterable, w):
+    return _rolling(iterable, w, "mean")
+
+
+# _________________________________________________________________________
+# NumPy path
+# _________________________________________________________________________
+
+def _extremeNumpy(arr, w, ufunc):
+    m = len(arr) - w + 1
+    if w <= SMALL_WINDOW:
+        windows = sliding_window_view(arr, w)       # (m, w) view, copy illa
+        return ufunc.reduce(windows, axis=1)
+    # last block fill pannra padding = last value (adha cover pannra
+    # windows-la last value already irukkum, result maaradhu)
+    blocks = np.pad(arr, (0, -len(arr) % w), mode="edge").reshape(-1, w)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return ufunc(suffix[:m], prefix[w - 1:w - 1 + m])
+
+
+def _sumNumpy(arr, w):
+    acc = np.float64 if arr.dtype.kind == "f" else None
+    c = np.cumsum(arr, dtype=acc)
+    c = np.concatenate((np.zeros(1, dtype=c.dtype), c))
+    return c[w:] - c[:-w]
+
+
+def slidingWindowsNumpy(arr, sizes, stats=STATS):
+    # ndarray (1-D) → {(stat, w): ndarray of len(arr) - w + 1}
+    sizes, stats = _checkArgs(sizes, stats)
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError("sliding windows need a 1-D array")
+    results = {}
+    for w in sizes:
+        if w > len(arr):
+            for stat in stats:
+                results[stat, w] = np.empty(0, dtype=float if stat == "mean" else arr.dtype)
+            continue
+        if "max" in stats:
+            results["max", w] = _extremeNumpy(arr, w, np.maximum)
+        if "min" in stats:
+            results["min", w] = _extremeNumpy(arr, w, np.minimum)
+        if "sum" in stats or "mean" in stats:
+            s = _sumNumpy(arr, w)
+            if "sum" in stats:
+                results["sum", w] = s
+            if "mean" in stats:
+                results["mean", w] = s / w
+    return results
+
+
+def windowStats(data, sizes, stats=STATS):
+    # ndarray → numpy path; list / array / iterator → one pass deques.
+    # Return {(stat, w): values}; non-numpy values list-aa (mean array('d'))
+    if np is not None and isinstance(data, np.ndarray):
+        return slidingWindowsNumpy(data, sizes, stats)
+    sizes, stats = _checkArgs(sizes, stats)
+    results = {(stat, w): (array("d") if stat == "mean" else []) for w in sizes for stat in stats}
+    for _, out in slidingWindows(data, sizes, stats):
+        for key, value in out.items():
+            results[key].append(value)
+    return results
+
+
+if __name__ == "__main__":
+    data = [1, 3, -1, -3, 5, 3, 6, 7]
+    print(list(rollingMax(data, 3)))        # [3, 3, 5, 5, 6, 7]
+    print(list(rollingMin(data, 3)))        # [-1, -3, -3, -3, 3, 3]
+    print(list(rollingSum(iter(data), 2)))
+
+    for key, values in windowStats(data, (2, 4), ("max", "mean")).items():
+        print(key, list(values))
+
+    if np is not None:
+        print(slidingWindowsNumpy(np.array(data), (3, 20))[("max", 3)])
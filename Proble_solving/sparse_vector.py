@@ -0,0 +1,186 @@
+# _________________________________________________________________________
+# 🟢 Sparse Vector – mostly-zero arrays-ku (index, value) pairs mattum
+# _________________________________________________________________________
+
+# Problem:
+# moveZeros-ku varra arrays 95%+ zeros. O(n) scan-la almost ellaa time-um
+# zeros-a paakkaradhula dhaan pogudhu.
+
+# Pattern:
+# Sparse representation – non-zero (index, value) mattum store.
+
+# Key logic:
+# * indices array('q') (sorted), values array('q' / 'd'), length n.
+#   Memory = nnz x 16 bytes, n-oda sambandham illa.
+# * compact (moveZeros): non-zeros front-la same order →
+#   indices = 0, 1, ..., nnz - 1. Values touch illa → O(nnz).
+# * rotate k: i → (i + k) % n. n - k-ku mela irukkura indices wrap aagi
+#   front-ku varum → bisect-la split point, rendu pieces swap → O(nnz),
+#   sorted order maintain aagum.
+#   n = 10, idx [1, 7, 8], k = 4 → [5, 11, 12] → wrap [1, 2] + [5]
+# * reverse: i → n - 1 - i, list order-um reverse.
+# * dot: rendu sorted index lists merge (two pointer) → O(nnz1 + nnz2).
+#   numpy irundha intersect1d.
+# * fromDense / toDense one pass (numpy na flatnonzero / scatter).
+
+# _________________________________________________________________________
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana array.array loops
+    np = None
+
+
+def _valueCode(values):
+    if isinstance(values, array):
+        return "d" if values.typecode in "fd" else "q"
+    return "d" if any(isinstance(v, float) for v in values) else "q"
+
+
+class SparseVector:
+
+    def __init__(self, n, indices=(), values=(), typecode=None):
+        self.n = n
+        self.indices = array("q", indices)
+        self.values = array(typecode or _valueCode(values), values)
+        if len(self.indices) != len(self.values):
+            raise ValueError("indices and values need the same length")
+        if any(not 0 <= i < n for i in self.indices[:1] + self.indices[-1:]) or \
+                any(a >= b for a, b in zip(self.indices, self.indices[1:])):
+            raise ValueError("indices must be strictly increasing and inside 0..n-1")
+
+    @classmethod
+    def _trusted(cls, n, indices, values):
+        # already valid arrays – validation loop skip
+        vec = cls.__new__(cls)
+        vec.n, vec.indices, vec.values = n, indices, values
+        return vec
+
+    # ____________________________ dense ↔ sparse ____________________________
+
+    @classmethod
+    def fromDense(cls, data):
+        n = len(data)
+        if np is not None and isinstance(data, np.ndarray):
+            idx = np.flatnonzero(data)
+            code = "d" if data.dtype.kind == "f" else "q"
+            return cls._trusted(n, array("q", idx.astype(np.int64).tobytes()),
+                                array(code, data[idx].astype(code).tobytes()))
+        indices = array("q")
+        values = []
+        for i, x in enumerate(data):       # one pass
+            if x:
+                indices.append(i)
+                values.append(x)
+        code = data.typecode if isinstance(data, array) and data.typecode in "qd" else _valueCode(values)
+        return cls._trusted(n, indices, array(code, values))
+
+    def toDense(self, kind="list"):
+        if kind == "ndarray":
+            out = np.zeros(self.n, dtype=self.values.typecode)
+            out[np.frombuffer(self.indices, dtype=np.int64)] = np.frombuffer(
+                self.values, dtype=self.values.typecode)
+            return out
+        zero = 0.0 if self.values.typecode == "d" else 0
+        out = [zero] * self.n
+        for i, x in zip(self.indices, self.values):
+            out[i] = x
+        return out if kind == "list" else array(self.values.typecode, out)
+
+    # ______________________________ O(nnz) ops ______________________________
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def compact(self):
+        # moveZeros: non-zeros 0..nnz-1-ku, order same
+        self.indices = array("q", range(len(self.indices)))
+        return self
+
+    def rotate(self, k):
+        # right rotate by k (rotateArray maadhiri)
+        n = self.n
+        if n == 0 or not self.indices:
+            return self
+        k %= n
+        if k == 0:
+            return self
+        split = bisect_left(self.indices, n - k)
+        head, tail = self.indices[split:], self.indices[:split]
+        self.indices = array("q", [i + k - n for i in head]) + array("q", [i + k for i in tail])
+        self.values = self.values[split:] + self.values[:split]
+        return self
+
+    def reverse(self):
+        last = self.n - 1
+        self.indices = array("q", [last - i for i in reversed(self.indices)])
+        self.values.reverse()
+        return self
+
+    def dot(self, other):
+        if isinstance(other, SparseVector):
+            if other.n != self.n:
+                raise ValueError(f"length mismatch: {self.n} vs {other.n}")
+            if np is not None:
+                a = np.frombuffer(self.indices, dtype=np.int64)
+                b = np.frombuffer(other.indices, dtype=np.int64)
+                _, ia, ib = np.intersect1d(a, b, assume_unique=True, return_indices=True)
+                va = np.frombuffer(self.values, dtype=self.values.typecode)[ia]
+                vb = np.frombuffer(other.values, dtype=other.values.typecode)[ib]
+                return (va * vb).sum().item()
+            total = 0
+            i = j = 0
+            ai, bi = self.indices, other.indices
+            while i < len(ai) and j < len(bi):     # two pointer merge
+                if ai[i] == bi[j]:
+                    total += self.values[i] * other.values[j]
+                    i += 1
+                    j += 1
+                elif ai[i] < bi[j]:
+                    i += 1
+                else:
+                    j += 1
+            return total
+        if len(other) != self.n:
+            raise ValueError(f"length mismatch: {self.n} vs {len(other)}")
+        return sum(x * other[i] for i, x in zip(self.indices, self.values))
+
+    # ________________________________ misc __________________________________
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("sparse vector index out of range")
+        t = bisect_left(self.indices, i)
+        if t < len(self.indices) and self.indices[t] == i:
+            return self.values[t]
+        return 0.0 if self.values.typecode == "d" else 0
+
+    def __eq__(self, other):
+        if not isinstance(other, SparseVector):
+            return NotImplemented
+        return self.n == other.n and self.indices == other.indices and \
+            list(self.values) == list(other.values)
+
+    def __repr__(self):
+        pairs = list(zip(self.indices[:6], self.values[:6]))
+        more = ", ..." if self.nnz > 6 else ""
+        return f"SparseVector(n={self.n}, nnz={self.nnz}, {pairs}{more})"
+
+
+if __name__ == "__main__":
+    v = SparseVector.fromDense([0, 0, 3, 0, 0, 0, 7, 0, 1, 0])
+    print(v)
+    print(v.rotate(4).toDense())        # [7, 0, 1, 0, 0, 0, 3, 0, 0, 0]
+    print(v.reverse().toDense())        # [0, 0, 0, 3, 0, 0, 0, 1, 0, 7]
+    print(v.compact().toDense())        # moveZeros → [3, 1, 7, 0, ...]
+    w = SparseVector(10, [2, 6], [2, 5])
+    print(v.dot(w), v.dot(list(range(10))))
@@ -0,0 +1,119 @@
+# _________________________________________________________________________
+# 🟢 Stream Rotate – generator / stdin records rotate (len() theriyaadhu)
+# _________________________________________________________________________
+
+# Problem:
+# rotateArray full list + len() kekkum. Records generator / stdin-la
+# irundhu varum, total count theriyaadhu, ellathaiyum load panna RAM podhaadhu.
+
+# Pattern:
+# Buffering + ring buffer (collections.deque maxlen) + spill to disk.
+
+# Key logic:
+# * Left rotate by k: output = items[k:] + items[:k]
+#   First k items mattum buffer, meedhi vandha udane yield, end-la
+#   buffer replay. Memory = k items.
+# * Right rotate by k: output = last k items + items[:n-k]
+#   Last k edhu nu end varaikkum theriyaadhu → deque(maxlen=k) ring buffer.
+#   Ring-la irundhu evict aagura front items (items[:n-k]) last-la dhaan
+#   yield pannanum, so SPILL_CHUNK items serndha temp file-ku pickle.
+#   End-la: ring yield, apram spill file replay. RAM = k + SPILL_CHUNK items.
+# * Stream k-a vida chinnadhu (n < k) → ValueError (default);
+#   wrap=True kuduthaa rotateArray maadhiri k % n.
+
+# Usage: python stream_rotate.py 3 < records.txt   (lines right rotate by 3)
+
+# _________________________________________________________________________
+
+import pickle
+import sys
+import tempfile
+from collections import deque
+from itertools import islice
+
+
+SPILL_CHUNK = 1 << 14   # items per pickle record in the spill file
+
+
+def _short(n, k, wrap):
+    if not wrap:
+        raise ValueError(f"stream has {n} items, fewer than k={k} (pass wrap=True to use k % n)")
+    return k % n if n else 0
+
+
+def rotateLeftStream(iterable, k, wrap=False):
+    # items[k:] + items[:k], first k items mattum memory-la
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    it = iter(iterable)
+    head = list(islice(it, k))
+    if len(head) < k:
+        s = _short(len(head), k, wrap)
+        yield from head[s:]
+        yield from head[:s]
+        return
+    yield from it
+    yield from head
+
+
+def rotateRightStream(iterable, k, wrap=False, spillDir=None):
+    # last k items + items[:n-k]; ring buffer k + spill file for the rest
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    if k == 0:
+        yield from iterable
+        return
+    ring = deque(maxlen=k)
+    pending = []        # ring-la irundhu evict aana items, spill aagala innum
+    spill = None
+    try:
+        for x in iterable:
+            if len(ring) == k:
+                pending.append(ring[0])   # append pannina idhu evict aagum
+                if len(pending) >= SPILL_CHUNK:
+                    if spill is None:
+                        spill = tempfile.TemporaryFile(dir=spillDir)
+                    pickle.dump(pending, spill, pickle.HIGHEST_PROTOCOL)
+                    pending = []
+            ring.append(x)
+
+        if len(ring) < k:
+            s = _short(len(ring), k, wrap)
+            items = list(ring)
+            yield from items[len(items) - s:]
+            yield from items[:len(items) - s]
+            return
+
+        yield from ring
+        if spill is not None:
+            spill.seek(0)
+            while True:
+                try:
+                    chunk = pickle.load(spill)
+                except EOFError:
+                    break
+                yield from chunk
+        yield from pending
+    finally:
+        if spill is not None:
+            spill.close()
+
+
+def rotateStream(iterable, k, wrap=False, spillDir=None):
+    # rotateArray maadhiri: k > 0 right, k < 0 left
+    if k >= 0:
+        return rotateRightStream(iterable, k, wrap, spillDir)
+    return rotateLeftStream(iterable, -k, wrap)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.stdout.writelines(rotateStream(sys.stdin, int(sys.argv[1]), wrap=True))
+    else:
+        print(list(rotateStream(iter(range(1, 8)), 3)))     # [5, 6, 7, 1, 2, 3, 4]
+        print(list(rotateStream(iter(range(1, 8)), -3)))    # [4, 5, 6, 7, 1, 2, 3]
+        print(list(rotateStream(iter([1, 2]), 5, wrap=True)))
+        try:
+            list(rotateStream(iter([1, 2]), 5))
+        except ValueError as e:
+            print(e)
@@ -0,0 +1,130 @@
+# _________________________________________________________________________
+# 🟢 String Rotation – rotate, rotation check (KMP), minimal rotation (Booth)
+# _________________________________________________________________________
+
+# Problem:
+# day2 plan-la "Rotate string". b, a-voda rotation-aa nu ovvoru k-kum
+# rotate panni compare pannina O(n²).
+
+# Pattern:
+# Index manipulation + string matching (KMP failure table).
+
+# Key logic:
+# * rotateString(s, k) = rotateArray maadhiri right rotation:
+#   "abcde", k = 2 → "deabc"
+# * b rotation of a na, a kandippa b + b-kulla irukkum:
+#   a = "abcde", b = "deabc", b + b = "deabcdeabc" → a at index 2
+#   Index p la found → b = right rotate a by p → shift = p.
+#   KMP → O(n) (text pointer back pogaadhu). b + b build pannala –
+#   index % n vechu virtual-aa padikkirom.
+# * Batch: one pattern, many candidates → pattern failure table oru
+#   thadava build, ovvoru candidate c + c-la search.
+# * Booth's algorithm → lexicographically smallest rotation start O(n).
+#   Rotations ellam same canonical form-ku varum (grouping / dedupe-ku).
+
+# Mistake I made:
+# Length check marandhen – "ab" "aba + aba"-la irukku, aana rotation illa.
+
+# _________________________________________________________________________
+
+
+def rotateString(s, k):
+    # right rotate by k (negative k → left)
+    n = len(s)
+    if n == 0:
+        return s
+    k %= n
+    return s[n - k:] + s[:n - k]
+
+
+def failureTable(pattern):
+    # fail[i] = pattern[:i + 1]-la longest proper prefix == suffix length
+    fail = [0] * len(pattern)
+    j = 0
+    for i in range(1, len(pattern)):
+        while j and pattern[i] != pattern[j]:
+            j = fail[j - 1]
+        if pattern[i] == pattern[j]:
+            j += 1
+        fail[i] = j
+    return fail
+
+
+def _searchDoubled(text, pattern, fail):
+    # pattern text + text-la first index (< len(text)), illana -1
+    n = len(text)
+    m = len(pattern)
+    j = 0
+    for i in range(2 * n - 1):
+        c = text[i % n]
+        while j and c != pattern[j]:
+            j = fail[j - 1]
+        if c == pattern[j]:
+            j += 1
+            if j == m:
+                return i - m + 1
+    return -1
+
+
+def rotationShift(a, b):
+    # k such that rotateString(a, k) == b (smallest k), illana -1
+    if len(a) != len(b):
+        return -1
+    if not a:
+        return 0
+    return _searchDoubled(b, a, failureTable(a))
+
+
+def isRotation(a, b):
+    return rotationShift(a, b) != -1
+
+
+def rotationShifts(pattern, candidates):
+    # batch: ovvoru candidate-kum rotationShift(pattern, c); table oru thadava
+    fail = failureTable(pattern)
+    shifts = []
+    for c in candidates:
+        if len(c) != len(pattern):
+            shifts.append(-1)
+        elif not c:
+            shifts.append(0)
+        else:
+            shifts.append(_searchDoubled(c, pattern, fail))
+    return shifts
+
+
+def leastRotation(s):
+    # Booth: s[i:] + s[:i] lexicographically smallest aagura smallest i
+    n = len(s)
+    if n == 0:
+        return 0
+    fail = [-1] * (2 * n)
+    k = 0
+    for j in range(1, 2 * n):
+        c = s[j % n]
+        i = fail[j - k - 1]
+        while i != -1 and c != s[(k + i + 1) % n]:
+            if c < s[(k + i + 1) % n]:
+                k = j - i - 1
+            i = fail[i]
+        if c != s[(k + i + 1) % n]:     # i == -1
+            if c < s[k % n]:            # s[k + i + 1] with i == -1
+                k = j
+            fail[j - k] = -1
+        else:
+            fail[j - k] = i + 1
+    return k % n
+
+
+def minimalRotation(s):
+    # canonical form: ellaa rotations-kum same result
+    i = leastRotation(s)
+    return s[i:] + s[:i]
+
+
+if __name__ == "__main__":
+    print(rotateString("abcde", 2))                     # deabc
+    print(rotationShift("abcde", "deabc"))              # 2
+    print(isRotation("ab", "aba"))                      # False
+    print(rotationShifts("waterbottle", ["erbottlewat", "bottlewater", "waterbottel"]))
+    print(minimalRotation("bbaca"), leastRotation("bbaca"))   # abbac 4
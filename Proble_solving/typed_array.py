@@ -0,0 +1,104 @@
+# _________________________________________________________________________
+# 🟢 IntArray / FloatArray – compact typed containers for day1 / day2 routines
+# _________________________________________________________________________
+
+# Problem:
+# list-la ovvoru element = 8 byte pointer + separate int object (28 bytes)
+# → ~36 bytes per number. 10 crore numbers na ~3.6 GB.
+
+# Pattern:
+# array.array subclass – raw C storage (int64 / float64 = 8 bytes each).
+
+# Key logic:
+# * IntArray = array("q"), FloatArray = array("d") + native methods:
+#   reverse() (array builtin, C loop), rotate(k), compact(keep).
+#   rotate / compact raw buffer mela: numpy irundha zero-copy view,
+#   illana rotation.py / partition.py chunked slice paths.
+# * Buffer protocol → memoryview(arr), toNumpy() copy illama same memory.
+#   Export irukkum bodhu append / extend pannina BufferError (resize
+#   panna mudiyaadhu) – view release pannitu resize pannunga.
+# * Indexing, slicing, len, iteration ellam array.array maadhiri dhaan,
+#   so day1 / day2 functions apdiye work aagum. (Slice result plain
+#   array.array – IntArray(arr[a:b]) venum na wrap pannunga.)
+
+# _________________________________________________________________________
+
+from array import array
+
+from array_backend import rotateArray
+from partition import KEEP_NONZERO, stablePartition
+
+try:
+    import numpy as np
+except ImportError:  # numpy illana pure array.array paths
+    np = None
+
+
+class _TypedArray(array):
+    TYPECODE = None
+
+    def __new__(cls, data=()):
+        return super().__new__(cls, cls.TYPECODE, data)
+
+    @classmethod
+    def zeros(cls, n):
+        return cls(bytes(n * array(cls.TYPECODE).itemsize))   # all-zero bytes == 0 / 0.0
+
+    @property
+    def nbytes(self):
+        return len(self) * self.itemsize
+
+    def rotate(self, k):
+        # right rotate by k, in place (rotateArray maadhiri)
+        rotateArray(self, k)
+        return self
+
+    def compact(self, keep=KEEP_NONZERO):
+        # keep items front-la (stable), return kept count
+        if np is not None and keep is KEEP_NONZERO and len(self):
+            view = self.toNumpy()
+            kept = view[view != 0]
+            m = len(kept)
+            view[:m] = kept
+            view[m:] = 0
+            return m
+        return stablePartition(self, keep)
+
+    def toNumpy(self):
+        # zero-copy ndarray over the same buffer
+        if np is None:
+            raise ImportError("toNumpy needs numpy")
+        return np.frombuffer(self, dtype=self.typecode)
+
+    def __repr__(self):
+        items = self.tolist() if len(self) <= 10 else self[:10].tolist() + ["..."]
+        return f"{type(self).__name__}({items}, len={len(self)})"
+
+
+class IntArray(_TypedArray):
+    TYPECODE = "q"
+
+
+class FloatArray(_TypedArray):
+    TYPECODE = "d"
+
+
+# Numbers (CPython 3.11, 1e6 values, tracemalloc):
+#
+# list of ints     ~36 MB  (8 B pointer + 28 B int object)
+# IntArray          ~8 MB
+# FloatArray        ~8 MB  (list of floats ~32 MB)
+
+
+if __name__ == "__main__":
+    arr = IntArray([0, 1, 0, 3, 12])
+    print(arr.compact(), arr)           # 3 IntArray([1, 3, 12, 0, 0])
+    arr.rotate(2)
+    arr.reverse()
+    print(arr, arr.nbytes)
+
+    view = memoryview(arr)
+    print(view.format, view.itemsize, view[0])
+    view.release()
+
+    print(FloatArray([1.5, 0.0, 2.5]).rotate(1))